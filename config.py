@@ -1,24 +1,9 @@
-"""Configuration settings for the AI clinic application."""
+"""Configuration settings for the AI clinic application.
 
-import os
-from typing import Optional
+The settings live in ``agent.config.settings``; this module re-exports them
+so existing ``from config import settings`` imports keep working.
+"""
 
+from agent.config.settings import Settings, get_settings, settings
 
-class Settings:
-    """Application settings."""
-    
-    # Database
-    DATABASE_URL: str = os.environ.get("DATABASE_URL", "sqlite:///./ai_clinic.db")
-    
-    # OpenAI
-    OPENAI_API_KEY: Optional[str] = os.environ.get("OPENAI_API_KEY")
-    
-    # Server
-    HOST: str = os.environ.get("HOST", "0.0.0.0")
-    PORT: int = int(os.environ.get("PORT", 8000))
-    
-    # LangGraph
-    LANGGRAPH_API_URL: str = os.environ.get("LANGGRAPH_API_URL", "http://localhost:8123")
-
-
-settings = Settings() 
\ No newline at end of file
+__all__ = ["Settings", "get_settings", "settings"]
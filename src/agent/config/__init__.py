@@ -0,0 +1,23 @@
+import importlib.util
+import sys
+
+from .settings import Settings, get_settings, settings
+
+
+def _lazy_import(name: str):
+    """Register a module that is only executed on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Consultation summary models, kept off the startup path
+schemas_extended = _lazy_import(f"{__name__}.schemas_extended")
+
+__all__ = ["Settings", "get_settings", "settings", "schemas_extended"]
@@ -0,0 +1,11 @@
+"""Dialect-aware column types shared by the database models."""
+
+from sqlalchemy import JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Binary JSONB on PostgreSQL (GIN-indexable, no reparse on read); plain JSON elsewhere
+JSONType = JSONB().with_variant(JSON(), "sqlite")
+
+# Server-side defaults for JSON collections, so INSERTs don't carry a Python-built value
+EMPTY_JSON_LIST = text("'[]'")
+EMPTY_JSON_OBJECT = text("'{}'")
@@ -1,21 +1,93 @@
 """Database configuration and session management."""
 
-import os
+import logging
+import time
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+
+from .settings import get_settings
+
+# Database URL (read from the environment once by Settings)
+DATABASE_URL = get_settings().DATABASE_URL
+
+# Compiled-statement cache entries per engine (SQLAlchemy default is 500)
+QUERY_CACHE_SIZE = 1500
+
+
+def _async_url(url: str) -> str:
+    """Swap the blocking DBAPI driver in a database URL for its asyncio counterpart."""
+    if url.startswith("sqlite"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    scheme, rest = url.split("://", 1)
+    return f"{scheme.split('+')[0]}+asyncpg://{rest}"
+
+
+def _engine_kwargs(url: str) -> dict:
+    """Build create_engine() arguments appropriate for the database backend."""
+    if url.startswith("sqlite"):
+        kwargs = {"connect_args": {"check_same_thread": False}}
+        # In-memory databases only exist on a single connection
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            kwargs["poolclass"] = StaticPool
+        return kwargs
+
+    # Connection pool tuning (ignored for SQLite)
+    settings = get_settings()
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "pool_use_lifo": True,
+    }
 
-# Database URL from environment variable
-DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./ai_clinic.db")
 
 # Create engine
-engine = create_engine(DATABASE_URL, echo=False)
+engine = create_engine(
+    DATABASE_URL, future=True, logging_name="ai_clinic", query_cache_size=QUERY_CACHE_SIZE, **_engine_kwargs(DATABASE_URL)
+)
+
+# Non-blocking engine for async request handlers
+async_engine = create_async_engine(
+    _async_url(DATABASE_URL),
+    logging_name="ai_clinic_async",
+    query_cache_size=QUERY_CACHE_SIZE,
+    **_engine_kwargs(DATABASE_URL),
+)
+
+
+def _log_slow_queries(target: Engine, threshold_ms: int) -> None:
+    """Warn about statements on ``target`` that take longer than ``threshold_ms``."""
+    slow_log = logging.getLogger("sql.slow")
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _check_duration(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start_time"].pop()) * 1000
+        if elapsed_ms > threshold_ms:
+            slow_log.warning("%.1fms %s", elapsed_ms, statement[:200])
+
+
+if get_settings().SQL_SLOW_MS > 0:
+    for _target in (engine, async_engine.sync_engine):
+        _log_slow_queries(_target, get_settings().SQL_SLOW_MS)
 
 # Create sessionmaker
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects keep their loaded state after commit; call db.refresh(obj) when a
+# post-commit reload is actually needed, and never share them across sessions.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True, expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 # Base class for models
 Base = declarative_base()
@@ -26,20 +98,41 @@ def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
+        db.expunge_all()
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session."""
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+        finally:
+            db.expunge_all()
+
+
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """Context manager for database session."""
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
+        db.expunge_all()
         db.close()
 
 
-def create_tables():
+async def create_tables():
     """Create all tables in the database."""
-    Base.metadata.create_all(bind=engine) 
\ No newline at end of file
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all) 
\ No newline at end of file
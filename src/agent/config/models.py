@@ -9,11 +9,18 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, JSON, Float, Enum as SQLEnum
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import DDL, Column, Integer, SmallInteger, String, DateTime, ForeignKey, Text, Boolean, Float, Index, CheckConstraint, UniqueConstraint, event
+from sqlalchemy.ext.orderinglist import ordering_list
+from sqlalchemy.orm import deferred, object_session, relationship, validates
+from sqlalchemy.sql import expression, func
 
-from .database import Base
+from .column_types import EMPTY_JSON_LIST, EMPTY_JSON_OBJECT, JSONType
+from .database import Base, engine
+
+# messages is hash-partitioned on PostgreSQL; partitioned tables must carry the
+# partition key in their primary key.
+PARTITION_MESSAGES = engine.dialect.name == "postgresql"
+MESSAGE_PARTITIONS = 16
 
 
 class SessionStatus(Enum):
@@ -57,12 +64,18 @@ class QuestionStatus(Enum):
     TIMEOUT = "TIMEOUT"
 
 
+def _enum_check(column: str, enum_cls: type) -> CheckConstraint:
+    """Restrict a VARCHAR enum column to the values of a Python Enum."""
+    allowed = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return CheckConstraint(f"{column} IN ({allowed})", name=f"ck_conversations_{column}")
+
+
 class User(Base):
     """User model with comprehensive health data."""
     __tablename__ = "users"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String, unique=True, index=True, nullable=False)
+    user_id = Column(String(64), unique=True, index=True, nullable=False)
     email = Column(String(255), unique=True, index=True)
     name = Column(String(255))
     phone = Column(String(50))
@@ -71,153 +84,239 @@ class User(Base):
     
     # Demographics
     age = Column(Integer, nullable=True)
-    birth_sex = Column(String, nullable=True)  # 'male', 'female', 'other', 'prefer_not_to_say'
+    birth_sex = Column(String(20), nullable=True)  # 'male', 'female', 'other', 'prefer_not_to_say'
     
     # Physical measurements
     height = Column(Float, nullable=True)  # in cm
     weight = Column(Float, nullable=True)  # in kg
     
     # Medical background
-    blood_type = Column(String, nullable=True)
-    allergies = Column(JSON, default=list, nullable=False)  # List of allergies
-    chronic_conditions = Column(JSON, default=list, nullable=False)  # List of conditions
-    current_medications = Column(JSON, default=list, nullable=False)  # List of medications
-    past_surgeries = Column(JSON, default=list, nullable=False)  # List of surgeries
-    hospitalizations = Column(JSON, default=list, nullable=False)  # Past hospitalizations
+    blood_type = Column(String(8), nullable=True)
+    allergies = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # List of allergies
+    chronic_conditions = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # List of conditions
+    current_medications = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # List of medications
+    past_surgeries = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # List of surgeries
+    hospitalizations = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # Past hospitalizations
     
     # Family history
-    family_history = Column(JSON, default=dict, nullable=False)  # Family medical history
+    family_history = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # Family medical history
     
     # Social history
-    smoking_status = Column(String, nullable=True)  # 'never', 'former', 'current'
-    alcohol_use = Column(String, nullable=True)  # 'none', 'occasional', 'regular', 'heavy'
-    substance_use = Column(JSON, default=dict, nullable=False)  # Substance use history
-    occupation = Column(String, nullable=True)
+    smoking_status = Column(String(16), nullable=True)  # 'never', 'former', 'current'
+    alcohol_use = Column(String(16), nullable=True)  # 'none', 'occasional', 'regular', 'heavy'
+    substance_use = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # Substance use history
+    occupation = Column(String(100), nullable=True)
     
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     last_active = Column(DateTime(timezone=True), server_default=func.now())
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, server_default=expression.true())
 
-    # Relationships
+    # Relationships (loaded on access; queries that need them add selectinload())
     conversations = relationship("Conversation", back_populates="user")
     symptoms = relationship("Symptom", back_populates="user")
     emergency_alerts = relationship("EmergencyAlert", back_populates="user")
 
 
 class Conversation(Base):
-    """Conversation model for tracking medical session state."""
+    """Conversation model for tracking medical session state.
+
+    Only the columns touched on every turn live here; rarely-read bookkeeping
+    is kept in the 1:1 ``ConversationMetadata`` row reachable via ``details``.
+    """
     __tablename__ = "conversations"
+    __table_args__ = (
+        _enum_check("status", SessionStatus),
+        _enum_check("emergency_level", EmergencyLevel),
+        _enum_check("data_completeness_level", DataCompletenessLevel),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    session_id = Column(String, unique=True, index=True, nullable=False)
-    status = Column(SQLEnum(SessionStatus), default=SessionStatus.ACTIVE)
+    session_id = Column(String(64), unique=True, index=True, nullable=False)
+    status = Column(String(16), default=SessionStatus.ACTIVE.value, nullable=False)
     
     # Medical session state
-    current_node = Column(String, default="Introduction", nullable=False)
-    current_phase = Column(String, default="intro", nullable=False)  # intro, chief_complaint, hpi, ros, etc.
-    question_index = Column(Integer, default=0, nullable=False)
-    invalid_attempts = Column(Integer, default=0, nullable=False)
-    current_question_id = Column(String, nullable=True)
-    
-    # Multi-symptom management
-    symptoms_queue = Column(JSON, default=list, nullable=False)  # Queue of symptoms to process
+    current_node = Column(String(48), default="Introduction", nullable=False)
+    current_phase = Column(String(32), default="intro", nullable=False)  # intro, chief_complaint, hpi, ros, etc.
+    question_index = Column(SmallInteger, default=0, nullable=False)
+    invalid_attempts = Column(SmallInteger, default=0, nullable=False)
+    current_question_id = Column(String(64), nullable=True)
     current_symptom_id = Column(Integer, ForeignKey("symptoms.id"), nullable=True)
-    processed_symptoms = Column(JSON, default=list, nullable=False)  # Completed symptom IDs
     
     # Emergency and triage
-    emergency_level = Column(SQLEnum(EmergencyLevel), default=EmergencyLevel.NONE)
-    red_flags = Column(JSON, default=list, nullable=False)  # List of detected red flags
+    emergency_level = Column(String(16), default=EmergencyLevel.NONE.value, nullable=False)
     
-    # Session variables and state
-    variables = Column(JSON, default=dict, nullable=False)
-    collected_data = Column(JSON, default=dict, nullable=False)  # Structured medical data
+    # Session variables and state (read and written on every turn)
+    # Large blobs load together on first access (undefer_group("large_json") to fetch up front)
+    variables = deferred(Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False), group="large_json")
+    collected_data = deferred(Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False), group="large_json")  # Structured medical data
     
     # Data completeness tracking
-    data_completeness_level = Column(SQLEnum(DataCompletenessLevel), default=DataCompletenessLevel.MINIMAL)
-    required_fields_completed = Column(JSON, default=dict, nullable=False)  # Track completion by category
-    skipped_questions = Column(JSON, default=list, nullable=False)  # Questions user chose to skip
-    unclear_responses = Column(JSON, default=list, nullable=False)  # Responses needing clarification
+    data_completeness_level = Column(String(16), default=DataCompletenessLevel.MINIMAL.value, nullable=False)
     
     # Transaction and persistence control
-    min_data_threshold_met = Column(Boolean, default=False, nullable=False)  # Minimum data for storage
-    can_be_saved = Column(Boolean, default=False, nullable=False)  # Whether session can be persisted
+    min_data_threshold_met = Column(Boolean, server_default=expression.false(), nullable=False)  # Minimum data for storage
+    can_be_saved = Column(Boolean, server_default=expression.false(), nullable=False)  # Whether session can be persisted
     completion_score = Column(Float, default=0.0, nullable=False)  # 0-100 completion percentage
     
-    # Timeout and session management
+    # Timestamps
     last_activity = Column(DateTime(timezone=True), server_default=func.now())
-    timeout_warnings = Column(Integer, default=0, nullable=False)
-    idle_timeout_minutes = Column(Integer, default=5, nullable=False)
-    session_timeout_minutes = Column(Integer, default=30, nullable=False)
-    auto_save_enabled = Column(Boolean, default=True, nullable=False)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    user = relationship("User", back_populates="conversations")
+    details = relationship(
+        "ConversationMetadata", back_populates="conversation", uselist=False, cascade="all, delete-orphan"
+    )
+    # Collections load on access, so a per-turn conversation lookup doesn't pull the whole
+    # history; listing routes batch-load messages with selectinload(Conversation.messages)
+    messages = relationship("Message", back_populates="conversation", order_by="Message.timestamp")
+    current_symptom = relationship("Symptom", foreign_keys=[current_symptom_id], lazy="joined")
+    question_tracking = relationship("QuestionTracking", back_populates="conversation")
+    emergency_alerts = relationship("EmergencyAlert", back_populates="conversation")
+
+    @validates("status", "emergency_level", "data_completeness_level")
+    def _store_enum_value(self, key, value):
+        """Store enum members by their string value."""
+        return value.value if isinstance(value, Enum) else value
+
+
+class ConversationMetadata(Base):
+    """Cold, rarely-read conversation data split out of the hot ``conversations`` row.
+
+    Loaded lazily on access; use ``joinedload(Conversation.details)`` when a
+    query is known to need it.
+    """
+    __tablename__ = "conversation_metadata"
+    __table_args__ = (
+        Index("ix_conv_meta_red_flags_gin", "red_flags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+    conversation_id = Column(Integer, ForeignKey("conversations.id", ondelete="CASCADE"), primary_key=True)
+    
+    # Multi-symptom management (the queue itself lives in conversation_symptom_queue)
+    processed_symptoms = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # Completed symptom IDs
+    
+    # Emergency and triage
+    red_flags = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # List of detected red flags
+    
+    # Data completeness tracking
+    required_fields_completed = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # Track completion by category
+    skipped_questions = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # Questions user chose to skip
+    unclear_responses = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # Responses needing clarification
+    
+    # Timeout and session management
+    timeout_warnings = Column(SmallInteger, default=0, nullable=False)
+    idle_timeout_minutes = Column(SmallInteger, default=5, nullable=False)
+    session_timeout_minutes = Column(SmallInteger, default=30, nullable=False)
+    auto_save_enabled = Column(Boolean, server_default=expression.true(), nullable=False)
     
     # Resume and continuation
-    can_resume = Column(Boolean, default=True, nullable=False)
-    resume_count = Column(Integer, default=0, nullable=False)
+    can_resume = Column(Boolean, server_default=expression.true(), nullable=False)
+    resume_count = Column(SmallInteger, default=0, nullable=False)
     last_resume_at = Column(DateTime(timezone=True), nullable=True)
     
     # Human handoff
-    requested_human_handoff = Column(Boolean, default=False, nullable=False)
+    requested_human_handoff = Column(Boolean, server_default=expression.false(), nullable=False)
     handoff_reason = Column(String, nullable=True)
-    escalated_to_human = Column(Boolean, default=False, nullable=False)
+    escalated_to_human = Column(Boolean, server_default=expression.false(), nullable=False)
     
     # Vitals (if provided)
-    current_bp_systolic = Column(Integer, nullable=True)
-    current_bp_diastolic = Column(Integer, nullable=True)
+    current_bp_systolic = Column(SmallInteger, nullable=True)
+    current_bp_diastolic = Column(SmallInteger, nullable=True)
     current_temperature = Column(Float, nullable=True)
-    current_heart_rate = Column(Integer, nullable=True)
+    current_heart_rate = Column(SmallInteger, nullable=True)
     
     # Timestamps
-    started_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    completed_at = Column(DateTime(timezone=True), nullable=True)
     expires_at = Column(DateTime(timezone=True), nullable=True)
     last_timeout_warning = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="conversations")
-    messages = relationship("Message", back_populates="conversation")
-    current_symptom = relationship("Symptom", foreign_keys=[current_symptom_id])
-    question_tracking = relationship("QuestionTracking", back_populates="conversation")
-    emergency_alerts = relationship("EmergencyAlert", back_populates="conversation")
+    conversation = relationship("Conversation", back_populates="details")
+    symptoms_queue = relationship(
+        "ConversationSymptomQueue",
+        order_by="ConversationSymptomQueue.position",
+        collection_class=ordering_list("position"),
+        cascade="all, delete-orphan",
+    )
+
+    def dequeue_symptom(self) -> Optional["ConversationSymptomQueue"]:
+        """Remove and return the entry at the head of the symptom queue."""
+        if not self.symptoms_queue:
+            return None
+        head = self.symptoms_queue[0]
+        session = object_session(self)
+        if session is not None and head in session:
+            # Delete the head first so the renumbered positions cannot collide with it
+            session.delete(head)
+            session.flush()
+        self.symptoms_queue.pop(0)
+        return head
+
+
+class ConversationSymptomQueue(Base):
+    """One queued symptom awaiting processing, kept in FIFO order by ``position``."""
+    __tablename__ = "conversation_symptom_queue"
+
+    conversation_id = Column(
+        Integer, ForeignKey("conversation_metadata.conversation_id", ondelete="CASCADE"), primary_key=True
+    )
+    position = Column(SmallInteger, primary_key=True, autoincrement=False)
+    symptom_id = Column(Integer, ForeignKey("symptoms.id"), nullable=False)
+
+    # Relationships
+    symptom = relationship("Symptom")
+
+
+@event.listens_for(Conversation, "init")
+def _attach_conversation_details(target, args, kwargs):
+    """Give every new conversation its metadata row."""
+    if "details" not in kwargs:
+        target.details = ConversationMetadata()
 
 
 class Symptom(Base):
     """Individual symptom with OLDCARTS data structure."""
     __tablename__ = "symptoms"
+    __table_args__ = (
+        Index("ix_symptoms_user_conv", "user_id", "conversation_id"),
+        CheckConstraint("severity BETWEEN 1 AND 10", name="ck_symptoms_severity"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
     
     # Basic symptom info
-    name = Column(String, nullable=False)  # e.g., "chest pain", "headache"
-    description = Column(Text, nullable=True)  # User's description
-    is_primary = Column(Boolean, default=False)  # Is this the chief complaint?
+    name = Column(String(255), nullable=False)  # e.g., "chest pain", "headache"
+    description = deferred(Column(Text, nullable=True))  # User's description
+    is_primary = Column(Boolean, server_default=expression.false())  # Is this the chief complaint?
     
     # OLDCARTS Framework
     onset = Column(String, nullable=True)  # When did it start?
     location = Column(String, nullable=True)  # Where exactly?
     duration = Column(String, nullable=True)  # Constant or intermittent?
     character = Column(String, nullable=True)  # Sharp, dull, burning, etc.
-    aggravating_factors = Column(JSON, default=list, nullable=False)  # What makes it worse?
-    relieving_factors = Column(JSON, default=list, nullable=False)  # What helps?
+    aggravating_factors = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # What makes it worse?
+    relieving_factors = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # What helps?
     timing = Column(String, nullable=True)  # Time patterns
-    severity = Column(Integer, nullable=True)  # 1-10 scale
+    severity = Column(SmallInteger, nullable=True)  # 1-10 scale
     radiation = Column(String, nullable=True)  # Does it spread?
     
     # Additional clinical data
     progression = Column(String, nullable=True)  # improving, worsening, unchanged
-    associated_symptoms = Column(JSON, default=list, nullable=False)  # Related symptoms
+    associated_symptoms = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # Related symptoms
     similar_episodes = Column(Text, nullable=True)  # Past similar episodes
-    treatments_tried = Column(JSON, default=list, nullable=False)  # What they've tried
+    treatments_tried = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # What they've tried
     
     # Data completeness tracking
-    oldcarts_completion = Column(JSON, default=dict, nullable=False)  # Track what's been asked
-    requires_followup = Column(Boolean, default=False)  # Needs clarification
-    followup_questions = Column(JSON, default=list, nullable=False)  # Questions to re-ask
+    oldcarts_completion = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # Track what's been asked
+    requires_followup = Column(Boolean, server_default=expression.false())  # Needs clarification
+    followup_questions = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # Questions to re-ask
     
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -231,61 +330,80 @@ class Symptom(Base):
 class Message(Base):
     """Message model for storing conversation history with medical context."""
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_conv_ts", "conversation_id", "timestamp"),
+        {"postgresql_partition_by": "HASH (conversation_id)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    conversation_id = Column(Integer, ForeignKey("conversations.id"), primary_key=PARTITION_MESSAGES, nullable=False)
     symptom_id = Column(Integer, ForeignKey("symptoms.id"), nullable=True)
     
     # Message details
-    question_id = Column(String, nullable=True)  # Which node/question
-    phase = Column(String, nullable=True)  # Which medical phase (hpi, ros, etc.)
-    role = Column(String, nullable=False)  # 'user' or 'assistant'
-    content = Column(Text, nullable=False)
+    question_id = Column(String(64), nullable=True)  # Which node/question
+    phase = Column(String(48), nullable=True)  # Which medical phase (hpi, ros, etc.)
+    role = Column(String(16), nullable=False)  # 'user' or 'assistant'
+    content = deferred(Column(Text, nullable=False))  # undefer(Message.content) for history views
     
     # Medical context
-    medical_category = Column(String, nullable=True)  # e.g., 'oldcarts', 'ros', 'emergency'
-    oldcarts_component = Column(String, nullable=True)  # onset, location, etc.
+    medical_category = Column(String(32), nullable=True)  # e.g., 'oldcarts', 'ros', 'emergency'
+    oldcarts_component = Column(String(32), nullable=True)  # onset, location, etc.
     
     # Validation and processing
-    is_valid = Column(Boolean, default=True)
+    is_valid = Column(Boolean, server_default=expression.true())
     validation_error = Column(String, nullable=True)
-    attempt_number = Column(Integer, default=1)
-    requires_clarification = Column(Boolean, default=False)
+    attempt_number = Column(SmallInteger, default=1)
+    requires_clarification = Column(Boolean, server_default=expression.false())
     
     # AI processing
-    extracted_data = Column(JSON, default=dict, nullable=False)  # Structured data extracted
+    extracted_data = deferred(Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False), group="large_json")  # Structured data extracted
     confidence_score = Column(Float, nullable=True)  # AI confidence in extraction
     
     # Metadata
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
-    is_system = Column(Boolean, default=False)
+    is_system = Column(Boolean, server_default=expression.false())
 
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
     symptom = relationship("Symptom")
 
 
+# One child table per hash bucket so per-conversation lookups touch a single partition
+for _remainder in range(MESSAGE_PARTITIONS):
+    event.listen(
+        Message.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE messages_p{_remainder} PARTITION OF messages "
+            f"FOR VALUES WITH (MODULUS {MESSAGE_PARTITIONS}, REMAINDER {_remainder})"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
 class EmergencyAlert(Base):
     """Emergency alerts and red flag tracking."""
     __tablename__ = "emergency_alerts"
+    __table_args__ = (
+        Index("ix_emergency_alerts_conv_created", "conversation_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Alert details
-    alert_type = Column(String, nullable=False)  # 'red_flag', 'emergency', 'urgent'
-    severity = Column(String, nullable=False)  # EmergencyLevel enum
-    trigger_symptoms = Column(JSON, default=list, nullable=False)  # What triggered it
+    alert_type = Column(String(32), nullable=False)  # 'red_flag', 'emergency', 'urgent'
+    severity = Column(String(16), nullable=False)  # EmergencyLevel enum
+    trigger_symptoms = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)  # What triggered it
     
     # Medical context
-    detected_condition = Column(String, nullable=True)  # Suspected condition
-    recommendation = Column(Text, nullable=False)  # What to recommend
+    detected_condition = Column(String(255), nullable=True)  # Suspected condition
+    recommendation = deferred(Column(Text, nullable=False))  # What to recommend
     
     # Response tracking
-    user_notified = Column(Boolean, default=False)
+    user_notified = Column(Boolean, server_default=expression.false())
     user_response = Column(Text, nullable=True)
-    escalated = Column(Boolean, default=False)
+    escalated = Column(Boolean, server_default=expression.false())
     
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -305,17 +423,17 @@ class ReviewOfSystems(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # System categories
-    general = Column(JSON, default=dict, nullable=False)  # fever, weight changes, fatigue
-    cardiovascular = Column(JSON, default=dict, nullable=False)  # chest pain, palpitations
-    respiratory = Column(JSON, default=dict, nullable=False)  # cough, shortness of breath
-    gastrointestinal = Column(JSON, default=dict, nullable=False)  # nausea, abdominal pain
-    genitourinary = Column(JSON, default=dict, nullable=False)  # urinary symptoms
-    musculoskeletal = Column(JSON, default=dict, nullable=False)  # joint pain, stiffness
-    neurological = Column(JSON, default=dict, nullable=False)  # headache, dizziness
-    dermatologic = Column(JSON, default=dict, nullable=False)  # rash, skin changes
-    psychiatric = Column(JSON, default=dict, nullable=False)  # mood, anxiety
-    endocrine = Column(JSON, default=dict, nullable=False)  # thirst, heat/cold intolerance
-    hematologic = Column(JSON, default=dict, nullable=False)  # bruising, bleeding
+    general = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # fever, weight changes, fatigue
+    cardiovascular = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # chest pain, palpitations
+    respiratory = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # cough, shortness of breath
+    gastrointestinal = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # nausea, abdominal pain
+    genitourinary = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # urinary symptoms
+    musculoskeletal = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # joint pain, stiffness
+    neurological = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # headache, dizziness
+    dermatologic = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # rash, skin changes
+    psychiatric = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # mood, anxiety
+    endocrine = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # thirst, heat/cold intolerance
+    hematologic = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # bruising, bleeding
     
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -331,16 +449,16 @@ class SessionState(Base):
     __tablename__ = "session_states"
 
     id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String, unique=True, index=True, nullable=False)
+    session_id = Column(String(64), unique=True, index=True, nullable=False)
     
     # Current state
-    current_node = Column(String, nullable=False)
-    question_index = Column(Integer, default=0)
-    invalid_attempts = Column(Integer, default=0)
-    current_question_id = Column(String, nullable=True)
+    current_node = Column(String(48), nullable=False)
+    question_index = Column(SmallInteger, default=0)
+    invalid_attempts = Column(SmallInteger, default=0)
+    current_question_id = Column(String(64), nullable=True)
     
     # Collected variables (JSON)
-    variables = Column(JSON, default=dict)
+    variables = Column(JSONType, server_default=EMPTY_JSON_OBJECT)
     
     # Metadata
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -351,36 +469,42 @@ class SessionState(Base):
 class QuestionTracking(Base):
     """Track individual questions and their completion status."""
     __tablename__ = "question_tracking"
+    __table_args__ = (
+        Index("ix_qt_conv_status", "conversation_id", "status"),
+        # Equality-only lookups; falls back to a plain index outside PostgreSQL
+        Index("ix_qt_hash", "question_hash", postgresql_using="hash"),
+        UniqueConstraint("conversation_id", "question_hash", name="uq_qt_conv_question_hash"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
     
     # Question identification
-    question_id = Column(String, nullable=False)  # Unique question identifier
-    question_category = Column(String, nullable=False)  # chief_complaint, hpi, ros, etc.
-    oldcarts_component = Column(String, nullable=True)  # onset, location, etc.
+    question_id = Column(String(64), nullable=False)  # Unique question identifier
+    question_category = Column(String(32), nullable=False)  # chief_complaint, hpi, ros, etc.
+    oldcarts_component = Column(String(32), nullable=True)  # onset, location, etc.
     question_text = Column(Text, nullable=False)  # The actual question asked
-    question_hash = Column(String, nullable=True)  # Hash for duplicate detection
+    question_hash = Column(String(16), nullable=True)  # 8-byte BLAKE2b hex digest for duplicate detection
     
     # Response tracking
-    status = Column(String, default=QuestionStatus.PENDING.value, nullable=False)
+    status = Column(String(16), default=QuestionStatus.PENDING.value, nullable=False)
     user_response = Column(Text, nullable=True)  # User's answer
-    extracted_data = Column(JSON, default=dict, nullable=False)  # Structured data extracted
+    extracted_data = Column(JSONType, server_default=EMPTY_JSON_OBJECT, nullable=False)  # Structured data extracted
     
     # Quality and completeness
-    response_clarity = Column(String, nullable=True)  # clear, vague, unclear
-    needs_followup = Column(Boolean, default=False, nullable=False)
-    followup_questions = Column(JSON, default=list, nullable=False)
+    response_clarity = Column(String(16), nullable=True)  # clear, vague, unclear
+    needs_followup = Column(Boolean, server_default=expression.false(), nullable=False)
+    followup_questions = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)
     skip_reason = Column(String, nullable=True)  # Why was this skipped
     
     # Attempts and validation
-    attempt_count = Column(Integer, default=0, nullable=False)
-    max_attempts = Column(Integer, default=3, nullable=False)
-    validation_errors = Column(JSON, default=list, nullable=False)
+    attempt_count = Column(SmallInteger, default=0, nullable=False)
+    max_attempts = Column(SmallInteger, default=3, nullable=False)
+    validation_errors = Column(JSONType, server_default=EMPTY_JSON_LIST, nullable=False)
     
     # Additional tracking fields for conversation memory
     last_asked_at = Column(DateTime(timezone=True), nullable=True)
-    response_received = Column(Boolean, default=False, nullable=False)
+    response_received = Column(Boolean, server_default=expression.false(), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Metadata
@@ -400,14 +524,14 @@ class DataCompletenessCheck(Base):
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
     
     # Completeness categories
-    chief_complaint_complete = Column(Boolean, default=False, nullable=False)
-    symptom_details_complete = Column(Boolean, default=False, nullable=False)
-    medical_history_complete = Column(Boolean, default=False, nullable=False)
-    medications_complete = Column(Boolean, default=False, nullable=False)
-    allergies_complete = Column(Boolean, default=False, nullable=False)
-    social_history_complete = Column(Boolean, default=False, nullable=False)
-    family_history_complete = Column(Boolean, default=False, nullable=False)
-    review_of_systems_complete = Column(Boolean, default=False, nullable=False)
+    chief_complaint_complete = Column(Boolean, server_default=expression.false(), nullable=False)
+    symptom_details_complete = Column(Boolean, server_default=expression.false(), nullable=False)
+    medical_history_complete = Column(Boolean, server_default=expression.false(), nullable=False)
+    medications_complete = Column(Boolean, server_default=expression.false(), nullable=False)
+    allergies_complete = Column(Boolean, server_default=expression.false(), nullable=False)
+    social_history_complete = Column(Boolean, server_default=expression.false(), nullable=False)
+    family_history_complete = Column(Boolean, server_default=expression.false(), nullable=False)
+    review_of_systems_complete = Column(Boolean, server_default=expression.false(), nullable=False)
     
     # Minimum thresholds
     min_fields_required = Column(Integer, default=8, nullable=False)  # Minimum fields for storage
@@ -419,8 +543,8 @@ class DataCompletenessCheck(Base):
     completion_percentage = Column(Float, default=0.0, nullable=False)
     
     # Transaction control
-    meets_storage_threshold = Column(Boolean, default=False, nullable=False)
-    can_complete_session = Column(Boolean, default=False, nullable=False)
+    meets_storage_threshold = Column(Boolean, server_default=expression.false(), nullable=False)
+    can_complete_session = Column(Boolean, server_default=expression.false(), nullable=False)
     
     # Metadata
     last_calculated = Column(DateTime(timezone=True), server_default=func.now())
@@ -437,14 +561,14 @@ class TimeoutEvent(Base):
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
     
     # Timeout details
-    event_type = Column(String, nullable=False)  # warning, final_warning, timeout
+    event_type = Column(String(32), nullable=False)  # warning, final_warning, timeout
     timeout_duration = Column(Integer, nullable=False)  # seconds of inactivity
     warning_message = Column(Text, nullable=True)  # Message sent to user
     
     # User response
-    user_responded = Column(Boolean, default=False, nullable=False)
+    user_responded = Column(Boolean, server_default=expression.false(), nullable=False)
     response_time = Column(Integer, nullable=True)  # seconds to respond
-    user_action = Column(String, nullable=True)  # continue, pause, exit
+    user_action = Column(String(16), nullable=True)  # continue, pause, exit
     
     # Metadata
     occurred_at = Column(DateTime(timezone=True), server_default=func.now())
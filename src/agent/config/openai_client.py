@@ -0,0 +1,63 @@
+"""Shared HTTP connection pools for OpenAI calls.
+
+Every ``ChatOpenAI`` in the app is handed these clients, so all model calls
+reuse one pool of warm keep-alive connections per process instead of each
+instance opening its own. ``warm_openai_clients()`` runs at startup to pay
+the DNS/TLS handshake before the first chat request.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+# HTTP/2 multiplexes concurrent calls over one connection; it needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+@lru_cache(maxsize=1)
+def get_openai_http_client() -> httpx.Client:
+    """Return the process-wide blocking client for synchronous ``ChatOpenAI`` calls."""
+    return httpx.Client(http2=HTTP2_AVAILABLE, limits=_LIMITS, timeout=_TIMEOUT)
+
+
+@lru_cache(maxsize=1)
+def get_openai_async_client() -> httpx.AsyncClient:
+    """Return the process-wide async client for ``ChatOpenAI.ainvoke``/``astream``."""
+    return httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=_LIMITS, timeout=_TIMEOUT)
+
+
+async def warm_openai_clients(api_key: Optional[str]) -> None:
+    """Open a connection in both pools with a cheap authenticated request."""
+    if not api_key:
+        return
+    url = f"{OPENAI_BASE_URL}/models"
+    headers = {"Authorization": f"Bearer {api_key}"}
+    try:
+        await asyncio.gather(
+            get_openai_async_client().get(url, headers=headers),
+            asyncio.to_thread(get_openai_http_client().get, url, headers=headers),
+        )
+    except httpx.HTTPError as e:
+        logger.warning("⚠️  OpenAI connection warm-up failed: %s", e)
+
+
+async def close_openai_clients() -> None:
+    """Close both pools (on application shutdown)."""
+    if get_openai_async_client.cache_info().currsize:
+        await get_openai_async_client().aclose()
+        get_openai_async_client.cache_clear()
+    if get_openai_http_client.cache_info().currsize:
+        get_openai_http_client().close()
+        get_openai_http_client.cache_clear()
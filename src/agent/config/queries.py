@@ -0,0 +1,34 @@
+"""Frequently executed statements, built once at import.
+
+Each request reuses the same statement objects with fresh bind parameters,
+so SQLAlchemy's compiled cache is hit instead of rebuilding the SQL.
+"""
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import undefer, undefer_group
+
+from .models import Conversation, Message, User
+
+# Conversation lookups
+CONVERSATION_BY_SESSION_ID = (
+    select(Conversation)
+    .where(Conversation.session_id == bindparam("session_id"))
+    .options(undefer_group("large_json"))
+)
+CONVERSATION_ID_BY_SESSION_ID = select(Conversation.id).where(Conversation.session_id == bindparam("session_id"))
+
+# Message history
+MESSAGES_BY_CONVERSATION = (
+    select(Message)
+    .where(Message.conversation_id == bindparam("conversation_id"))
+    .order_by(Message.timestamp)
+    .options(undefer(Message.content))
+)
+MESSAGE_COUNT_BY_CONVERSATION = (
+    select(func.count())
+    .select_from(Message)
+    .where(Message.conversation_id == bindparam("conversation_id"))
+)
+
+# Users
+USER_BY_USER_ID = select(User).where(User.user_id == bindparam("user_id"))
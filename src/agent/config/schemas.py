@@ -1,376 +1,510 @@
 """Enhanced Pydantic schemas for Vi Symptom Agent medical data."""
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from array import array
+from typing import Optional, Dict, Any, List, Literal, Tuple, Type, TypeVar, Union, get_args
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, computed_field
+from pydantic.dataclasses import dataclass
+import sys
+import time
 from datetime import datetime
-from enum import Enum
+from typing_extensions import Annotated, TypedDict
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+MessageRole = Literal["user", "assistant", "system"]
+
+# Responses are built once and serialised; requests carry untrusted client input
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_assignment=False, arbitrary_types_allowed=False)
+REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid")
+
+# High-cardinality DTOs are slotted, frozen dataclasses (slots need Python 3.10+)
+DTO_OPTIONS: Dict[str, Any] = {"frozen": True, "slots": sys.version_info >= (3, 10)}
+
+
+def now_ms() -> int:
+    """Current time as epoch milliseconds."""
+    return int(time.time() * 1000)
+
+
+def epoch_ms(value: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime (e.g. from a DB row) to epoch milliseconds."""
+    return int(value.timestamp() * 1000) if value is not None else None
+
+
+def build(cls: Type[ModelT], **data: Any) -> ModelT:
+    """Construct a response model from trusted, server-built data without re-validating it.
+
+    Request models carrying client input must keep going through normal validation.
+    """
+    return cls.model_construct(**data)
 
 
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str = "healthy"
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp_ms: int = Field(default_factory=now_ms)
     service: str = "Vi Symptom Agent"
     version: str = "2.0.0"
 
 
 class UserCreate(BaseModel):
     """Schema for creating a new user."""
-    user_id: str = Field(..., description="Unique identifier for the user")
+    user_id: str
 
 
 # Session Management Schemas
 class ConversationStart(BaseModel):
     """Schema for starting a new conversation."""
-    user_id: str = Field(..., description="Unique user identifier")
-    patient_metadata: Optional[Dict[str, Any]] = Field(None, description="Optional patient metadata")
+    user_id: str
+    patient_metadata: Optional[Dict[str, Any]] = None
 
 
 class SessionStartResponse(BaseModel):
     """Response for starting a new session."""
-    session_id: str = Field(..., description="Unique session identifier")
-    first_prompt: str = Field(..., description="Initial prompt for the user")
-    conversation_id: int = Field(..., description="Database conversation ID")
+    kind: Literal["start"] = "start"
+    session_id: str
+    first_prompt: str
+    conversation_id: int
 
 
 class SessionResumeResponse(BaseModel):
     """Response for resuming an existing session."""
-    session_id: str = Field(..., description="Session identifier")
-    last_message: str = Field(..., description="Last message to continue from")
-    current_node: Optional[str] = Field(None, description="Current conversation node")
-    conversation_id: int = Field(..., description="Database conversation ID")
+    kind: Literal["resume"] = "resume"
+    session_id: str
+    last_message: str
+    current_node: Optional[str] = None
+    conversation_id: int
+
+
+# Session start/resume payload, dispatched on its kind
+SessionResponse = Annotated[Union[SessionStartResponse, SessionResumeResponse], Field(discriminator="kind")]
 
 
-class MessageIn(BaseModel):
+@dataclass(config=REQUEST_MODEL_CONFIG, **DTO_OPTIONS)
+class MessageIn:
     """Schema for incoming message."""
-    role: str = Field(..., description="Message role (user or assistant)")
-    content: str = Field(..., description="Message content")
+    role: MessageRole
+    content: str
 
 
-class MessageOut(BaseModel):
+@dataclass(**DTO_OPTIONS)
+class MessageOut:
     """Schema for outgoing message."""
-    role: str = Field(..., description="Message role")
-    content: str = Field(..., description="Message content")
-    timestamp: datetime = Field(..., description="Message timestamp")
-    is_system: bool = Field(False, description="Whether this is a system message")
+    role: MessageRole
+    content: str
+    timestamp_ms: int
+    is_system: bool = False
 
 
-class EmergencyLevel(str, Enum):
-    """Emergency triage levels."""
-    NONE = "NONE"
-    LOW = "LOW"
-    MODERATE = "MODERATE"
-    HIGH = "HIGH"
-    CRITICAL = "CRITICAL"
+# Emergency triage levels
+EmergencyLevel = Literal["NONE", "LOW", "MODERATE", "HIGH", "CRITICAL"]
+EMERGENCY_LEVELS = frozenset(get_args(EmergencyLevel))
 
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint."""
-    user_id: str = Field(..., description="Unique identifier for the user", example="user_123")
-    message: str = Field("", description="User's message (empty for initial greeting)", example="I am 25 years old")
-    session_id: Optional[str] = Field("", description="Session ID for continuing conversation (empty for new session)", example="vi_dynamic_20250616_123456_789")
-
-    class Config:
-        schema_extra = {
-            "examples": [
-                {
-                    "summary": "Start new conversation",
-                    "description": "Start a new conversation with empty message to get greeting",
-                    "value": {
-                        "user_id": "user_123",
-                        "message": "",
-                        "session_id": ""
-                    }
-                },
-                {
-                    "summary": "Provide age",
-                    "description": "Continue conversation by providing age",
-                    "value": {
-                        "user_id": "user_123",
-                        "message": "I am 25 years old",
-                        "session_id": "vi_dynamic_20250616_123456_789"
-                    }
-                },
-                {
-                    "summary": "Comprehensive symptom description",
-                    "description": "Provide detailed symptom information",
-                    "value": {
-                        "user_id": "user_123",
-                        "message": "I have severe headaches on the right side of my head that started 3 days ago. They are throbbing and 8/10 in pain. Light makes them worse.",
-                        "session_id": "vi_dynamic_20250616_123456_789"
-                    }
-                },
-                {
-                    "summary": "Emergency scenario",
-                    "description": "Emergency chest pain scenario",
-                    "value": {
-                        "user_id": "user_123",
-                        "message": "I am a 45-year-old male with severe crushing chest pain that started 1 hour ago. The pain radiates to my left arm and is 9/10 severity. I also have shortness of breath and nausea.",
-                        "session_id": ""
-                    }
-                }
-            ]
-        }
-
-
-class ConversationMessage(BaseModel):
-    """Individual conversation message."""
-    role: str = Field(..., description="Message role (user or assistant)")
-    content: str = Field(..., description="Message content")
-    timestamp: str = Field(..., description="Message timestamp in ISO format")
-    phase: str = Field(..., description="Conversation phase when message was sent")
+    model_config = REQUEST_MODEL_CONFIG
+
+    user_id: str
+    message: str = ""
+    session_id: Optional[str] = ""
+
+
+@dataclass(**DTO_OPTIONS)
+class _HistoryMessage:
+    """Fields shared by every conversation history entry."""
+    content: str
+    timestamp: str
+    phase: Optional[str] = None
+
+
+@dataclass(**DTO_OPTIONS)
+class UserMessage(_HistoryMessage):
+    """Message written by the patient."""
+    role: Literal["user"] = "user"
+
+
+@dataclass(**DTO_OPTIONS)
+class AssistantMessage(_HistoryMessage):
+    """Message written by Vi."""
+    role: Literal["assistant"] = "assistant"
+
+
+@dataclass(**DTO_OPTIONS)
+class SystemMessage(_HistoryMessage):
+    """System-generated message."""
+    role: Literal["system"] = "system"
+
+
+# Individual conversation message, dispatched on its role
+ConversationMessage = Annotated[Union[UserMessage, AssistantMessage, SystemMessage], Field(discriminator="role")]
+
+HISTORY_MESSAGE_TYPES = {"user": UserMessage, "assistant": AssistantMessage, "system": SystemMessage}
+
+
+class ExtractionResult(TypedDict, total=False):
+    """Structured output of the extraction agent."""
+    target_field: str
+    extracted_value: Any
+    additional_data: Dict[str, Any]
+    extraction_confidence: float
+    needs_clarification: bool
 
 
 class AIContext(BaseModel):
     """AI agent context information."""
-    last_agent_action: Optional[str] = Field(None, description="Last action performed by an agent")
-    last_extraction: Optional[Dict[str, Any]] = Field(None, description="Details of the last extraction attempt")
-    orchestrator_reasoning: Optional[str] = Field(None, description="Orchestrator's reasoning for routing decisions")
-    current_field: Optional[str] = Field(None, description="Current field being collected")
-    completion_readiness: Optional[float] = Field(None, description="Completion readiness score (0.0-1.0)")
+    last_agent_action: Optional[str] = None
+    last_extraction: Optional[ExtractionResult] = None
+    orchestrator_reasoning: Optional[str] = None
+    current_field: Optional[str] = None
+    completion_readiness: Optional[float] = None
+
+
+# OLDCARTS fields tracked for progress, in display order
+OLDCARTS_FIELDS: Tuple[str, ...] = (
+    "age",
+    "biological_sex",
+    "primary_complaint",
+    "onset",
+    "location",
+    "duration",
+    "character",
+    "severity",
+)
+
+# One progress bit per tracked field
+OLDCARTS_BITS = {name: 1 << i for i, name in enumerate(OLDCARTS_FIELDS)}
+
+OLDCARTS_AGE = OLDCARTS_BITS["age"]
+OLDCARTS_SEX = OLDCARTS_BITS["biological_sex"]
+OLDCARTS_COMPLAINT = OLDCARTS_BITS["primary_complaint"]
+OLDCARTS_ONSET = OLDCARTS_BITS["onset"]
+OLDCARTS_LOCATION = OLDCARTS_BITS["location"]
+OLDCARTS_DURATION = OLDCARTS_BITS["duration"]
+OLDCARTS_CHARACTER = OLDCARTS_BITS["character"]
+OLDCARTS_SEVERITY = OLDCARTS_BITS["severity"]
+
+# Checklist for every possible mask, indexed by the mask itself
+_OLDCARTS_CHECKLISTS = tuple(
+    {name: "✅" if mask & bit else "❌" for name, bit in OLDCARTS_BITS.items()}
+    for mask in range(1 << len(OLDCARTS_FIELDS))
+)
+
+
+def oldcarts_mask(collected_data: Dict[str, Any]) -> int:
+    """Progress bitmask for the OLDCARTS fields present in ``collected_data``."""
+    mask = 0
+    for name, bit in OLDCARTS_BITS.items():
+        if collected_data.get(name):
+            mask |= bit
+    return mask
+
+
+def completion_ratio(mask: int) -> float:
+    """Fraction of OLDCARTS fields set in ``mask``."""
+    return bin(mask).count("1") / len(OLDCARTS_FIELDS)
 
 
 class OldcartsProgress(BaseModel):
-    """OLDCARTS field collection progress."""
-    age: str = Field(..., description="Age collection status", example="✅")
-    biological_sex: str = Field(..., description="Biological sex collection status", example="✅")
-    primary_complaint: str = Field(..., description="Primary complaint collection status", example="❌")
-    onset: str = Field(..., description="Onset collection status", example="❌")
-    location: str = Field(..., description="Location collection status", example="❌")
-    duration: str = Field(..., description="Duration collection status", example="❌")
-    character: str = Field(..., description="Character collection status", example="❌")
-    severity: str = Field(..., description="Severity collection status", example="❌")
+    """OLDCARTS field collection progress.
+
+    Stored as one bitmask; serialised as the flat per-field ✅/❌ checklist.
+    """
+    progress_mask: int = Field(0, ge=0, lt=1 << len(OLDCARTS_FIELDS), exclude=True)
+
+    @computed_field
+    @property
+    def age(self) -> str:
+        """Age collection status."""
+        return _OLDCARTS_CHECKLISTS[self.progress_mask]["age"]
+
+    @computed_field
+    @property
+    def biological_sex(self) -> str:
+        """Biological sex collection status."""
+        return _OLDCARTS_CHECKLISTS[self.progress_mask]["biological_sex"]
+
+    @computed_field
+    @property
+    def primary_complaint(self) -> str:
+        """Primary complaint collection status."""
+        return _OLDCARTS_CHECKLISTS[self.progress_mask]["primary_complaint"]
+
+    @computed_field
+    @property
+    def onset(self) -> str:
+        """Onset collection status."""
+        return _OLDCARTS_CHECKLISTS[self.progress_mask]["onset"]
+
+    @computed_field
+    @property
+    def location(self) -> str:
+        """Location collection status."""
+        return _OLDCARTS_CHECKLISTS[self.progress_mask]["location"]
+
+    @computed_field
+    @property
+    def duration(self) -> str:
+        """Duration collection status."""
+        return _OLDCARTS_CHECKLISTS[self.progress_mask]["duration"]
+
+    @computed_field
+    @property
+    def character(self) -> str:
+        """Character collection status."""
+        return _OLDCARTS_CHECKLISTS[self.progress_mask]["character"]
+
+    @computed_field
+    @property
+    def severity(self) -> str:
+        """Severity collection status."""
+        return _OLDCARTS_CHECKLISTS[self.progress_mask]["severity"]
+
+    @property
+    def fields_collected(self) -> int:
+        """Number of OLDCARTS fields collected."""
+        return bin(self.progress_mask).count("1")
+
+    @property
+    def completion_percentage(self) -> float:
+        """OLDCARTS completion as a percentage."""
+        return round(completion_ratio(self.progress_mask) * 100, 1)
 
 
 class Summary(BaseModel):
     """Conversation summary statistics."""
-    total_fields_possible: int = Field(..., description="Total number of fields that can be collected", example=15)
-    fields_completed: int = Field(..., description="Number of fields successfully collected", example=3)
-    completion_percentage: float = Field(..., description="Completion percentage", example=20.0)
+    total_fields_possible: int
+    fields_completed: int
+    completion_percentage: float
 
 
 class ChatResponse(BaseModel):
     """Response model for chat endpoint."""
-    session_id: str = Field(..., description="Session identifier", example="vi_dynamic_20250616_123456_789")
-    message: str = Field(..., description="AI assistant's response message", example="Hello! I'm Vi, your virtual health assistant...")
-    conversation_complete: bool = Field(..., description="Whether the conversation is complete", example=False)
+    model_config = RESPONSE_MODEL_CONFIG
+
+    session_id: str
+    message: str
+    conversation_complete: bool
     
     # Medical data collection
-    collected_data: Dict[str, Any] = Field(..., description="All collected medical data", example={"age": "25", "biological_sex": "Female"})
-    fields_collected: int = Field(..., description="Number of fields collected", example=2)
-    next_field: str = Field(..., description="Next field to collect", example="primary_complaint")
-    current_section: str = Field(..., description="Current conversation section", example="collecting_primary_complaint")
+    collected_data: Dict[str, Any]
+    fields_collected: int
+    next_field: str
+    current_section: str
     
     # Progress and status
-    completion_readiness: float = Field(..., description="Completion readiness score (0.0-1.0)", example=0.2)
-    emergency_level: EmergencyLevel = Field(..., description="Emergency triage level", example=EmergencyLevel.NONE)
+    completion_readiness: float
+    emergency_level: EmergencyLevel
     
     # Conversation context
-    conversation_history: List[ConversationMessage] = Field(..., description="Complete conversation history")
-    total_messages: int = Field(..., description="Total number of messages in conversation", example=4)
+    conversation_history: List[ConversationMessage]
+    total_messages: int
     
     # Agent context
-    ai_context: AIContext = Field(..., description="AI agent context and reasoning")
+    ai_context: AIContext
     
     # Progress tracking
-    oldcarts_progress: OldcartsProgress = Field(..., description="OLDCARTS field collection progress")
-    summary: Summary = Field(..., description="Conversation summary statistics")
+    oldcarts_progress: OldcartsProgress
+    summary: Summary
 
 
 class SessionStartRequest(BaseModel):
     """Request to start a new medical consultation session."""
-    user_id: str = Field(..., description="Unique user identifier")
-    patient_metadata: Optional[Dict[str, Any]] = Field(None, description="Optional patient metadata")
+    model_config = REQUEST_MODEL_CONFIG
+
+    user_id: str
+    patient_metadata: Optional[Dict[str, Any]] = None
 
 
-class EmergencyAlert(BaseModel):
+@dataclass(**DTO_OPTIONS)
+class EmergencyAlert:
     """Emergency alert information."""
-    alert_id: str = Field(..., description="Unique alert identifier")
-    severity: str = Field(..., description="Emergency severity level")
-    trigger_symptoms: List[str] = Field(..., description="Symptoms that triggered the alert")
-    recommendation: str = Field(..., description="Recommended action")
-    timestamp: datetime = Field(..., description="When alert was created")
+    alert_id: str
+    severity: str
+    trigger_symptoms: List[str]
+    recommendation: str
+    timestamp_ms: int
 
 
-class SymptomData(BaseModel):
+@dataclass(**DTO_OPTIONS)
+class SymptomData:
     """OLDCARTS symptom data structure."""
-    name: str = Field(..., description="Symptom name")
-    is_primary: bool = Field(False, description="Whether this is the primary complaint")
+    name: str
+    is_primary: bool = False
     
     # OLDCARTS components
-    onset: Optional[str] = Field(None, description="When symptom started")
-    location: Optional[str] = Field(None, description="Where symptom is located")
-    duration: Optional[str] = Field(None, description="Duration pattern of symptom")
-    character: Optional[str] = Field(None, description="Character/quality of symptom")
-    aggravating_factors: Optional[List[str]] = Field(None, description="What makes it worse")
-    relieving_factors: Optional[List[str]] = Field(None, description="What makes it better")
-    timing: Optional[str] = Field(None, description="Timing patterns")
-    severity: Optional[int] = Field(None, ge=1, le=10, description="Severity on 1-10 scale")
-    radiation: Optional[str] = Field(None, description="Does it spread/radiate")
+    onset: Optional[str] = None
+    location: Optional[str] = None
+    duration: Optional[str] = None
+    character: Optional[str] = None
+    aggravating_factors: List[str] = Field(default_factory=list)
+    relieving_factors: List[str] = Field(default_factory=list)
+    timing: Optional[str] = None
+    severity: Optional[int] = Field(None, ge=1, le=10)
+    radiation: Optional[str] = None
     
     # Additional data
-    progression: Optional[str] = Field(None, description="How symptom has changed")
-    associated_symptoms: Optional[List[str]] = Field(None, description="Related symptoms")
-    similar_episodes: Optional[str] = Field(None, description="Past similar episodes")
-    treatments_tried: Optional[List[str]] = Field(None, description="Treatments attempted")
+    progression: Optional[str] = None
+    associated_symptoms: List[str] = Field(default_factory=list)
+    similar_episodes: Optional[str] = None
+    treatments_tried: List[str] = Field(default_factory=list)
     
     # Completeness tracking
-    oldcarts_completion: Optional[Dict[str, bool]] = Field(None, description="OLDCARTS completion status")
+    oldcarts_completion: Optional[Dict[str, bool]] = None
 
 
-class MedicalHistory(BaseModel):
-    """Comprehensive medical history data."""
-    # Demographics
-    age: Optional[int] = Field(None, ge=0, le=150, description="Patient age")
-    birth_sex: Optional[str] = Field(None, description="Biological sex assigned at birth")
-    
-    # Medical background
-    chronic_conditions: Optional[List[str]] = Field(None, description="Chronic medical conditions")
-    current_medications: Optional[List[str]] = Field(None, description="Current medications")
-    allergies: Optional[List[str]] = Field(None, description="Known allergies")
-    past_surgeries: Optional[List[str]] = Field(None, description="Previous surgeries")
-    hospitalizations: Optional[List[str]] = Field(None, description="Past hospitalizations")
-    
-    # Family history
-    family_history: Optional[Dict[str, Any]] = Field(None, description="Family medical history")
-    
-    # Social history
-    smoking_status: Optional[str] = Field(None, description="Smoking status")
-    alcohol_use: Optional[str] = Field(None, description="Alcohol use pattern")
-    substance_use: Optional[Dict[str, Any]] = Field(None, description="Substance use history")
-    occupation: Optional[str] = Field(None, description="Occupation")
-
-
-class VitalSigns(BaseModel):
-    """Vital signs and measurements."""
-    blood_pressure_systolic: Optional[int] = Field(None, ge=50, le=250, description="Systolic BP")
-    blood_pressure_diastolic: Optional[int] = Field(None, ge=30, le=150, description="Diastolic BP")
-    heart_rate: Optional[int] = Field(None, ge=30, le=220, description="Heart rate (BPM)")
-    temperature: Optional[float] = Field(None, ge=90.0, le=110.0, description="Temperature (F)")
-    height: Optional[float] = Field(None, ge=50.0, le=300.0, description="Height (cm)")
-    weight: Optional[float] = Field(None, ge=10.0, le=500.0, description="Weight (kg)")
-
-
-class ReviewOfSystems(BaseModel):
-    """Review of Systems (ROS) data."""
-    general: Optional[Dict[str, Any]] = Field(None, description="General symptoms")
-    cardiovascular: Optional[Dict[str, Any]] = Field(None, description="Cardiovascular symptoms")
-    respiratory: Optional[Dict[str, Any]] = Field(None, description="Respiratory symptoms")
-    gastrointestinal: Optional[Dict[str, Any]] = Field(None, description="GI symptoms")
-    genitourinary: Optional[Dict[str, Any]] = Field(None, description="GU symptoms")
-    musculoskeletal: Optional[Dict[str, Any]] = Field(None, description="Musculoskeletal symptoms")
-    neurological: Optional[Dict[str, Any]] = Field(None, description="Neurological symptoms")
-    dermatologic: Optional[Dict[str, Any]] = Field(None, description="Skin symptoms")
-    psychiatric: Optional[Dict[str, Any]] = Field(None, description="Mental health symptoms")
-    endocrine: Optional[Dict[str, Any]] = Field(None, description="Endocrine symptoms")
-    hematologic: Optional[Dict[str, Any]] = Field(None, description="Blood-related symptoms")
+class SymptomBatch:
+    """Column-wise view of a list of symptoms for scoring and red-flag scans.
+
+    Severities are packed into a signed-byte array, with 0 for "not reported".
+    """
+    __slots__ = ("names", "severity", "is_primary")
+
+    def __init__(self, names: Tuple[str, ...], severity: array, is_primary: array):
+        self.names = names
+        self.severity = severity
+        self.is_primary = is_primary
+
+    @classmethod
+    def from_symptoms(cls, symptoms: List[SymptomData]) -> "SymptomBatch":
+        """Pack validated symptoms into parallel arrays."""
+        return cls(
+            tuple(s.name for s in symptoms),
+            array("b", [s.severity or 0 for s in symptoms]),
+            array("b", [s.is_primary for s in symptoms]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def severe(self, threshold: int = 8) -> List[str]:
+        """Names of symptoms rated at or above ``threshold``."""
+        return [name for name, sev in zip(self.names, self.severity) if sev >= threshold]
+
+    def max_severity(self) -> int:
+        """Highest reported severity, or 0 if none was reported."""
+        return max(self.severity, default=0)
 
 
 class SessionStatus(BaseModel):
     """Comprehensive session status."""
-    session_id: str = Field(..., description="Session identifier")
-    status: str = Field(..., description="Session status")
-    current_node: str = Field(..., description="Current conversation node")
-    current_phase: str = Field(..., description="Current medical phase")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    session_id: str
+    status: str
+    current_node: str
+    current_phase: str
     
     # Emergency status
-    emergency_level: str = Field("none", description="Current emergency level")
-    red_flags: List[Dict[str, Any]] = Field(default_factory=list, description="Detected red flags")
+    emergency_level: EmergencyLevel = "NONE"
+    red_flags: List[Dict[str, Any]] = Field(default_factory=list)
     
     # Progress tracking
-    symptoms_queue: List[str] = Field(default_factory=list, description="Symptoms queued for processing")
-    processed_symptoms: List[str] = Field(default_factory=list, description="Completed symptoms")
-    symptoms_collected: int = Field(0, description="Number of symptoms collected")
-    emergency_alerts: int = Field(0, description="Number of emergency alerts")
+    symptoms_queue: List[str] = Field(default_factory=list)
+    processed_symptoms: List[str] = Field(default_factory=list)
+    symptoms_collected: int = 0
+    emergency_alerts: int = 0
     
     # Data collection
-    variables: Dict[str, Any] = Field(default_factory=dict, description="Collected variables")
+    variables: Dict[str, Any] = Field(default_factory=dict)
     
     # Timestamps
-    started_at: datetime = Field(..., description="Session start time")
-    updated_at: Optional[datetime] = Field(None, description="Last update time")
-    expires_at: Optional[datetime] = Field(None, description="Session expiration time")
-
-
-class DetailedSessionSummary(BaseModel):
-    """Detailed medical consultation summary."""
-    session_info: Dict[str, Any] = Field(..., description="Session metadata")
-    patient_data: Dict[str, Any] = Field(..., description="Patient demographic and medical data")
-    symptoms: List[SymptomData] = Field(default_factory=list, description="Collected symptoms")
-    emergency_alerts: List[EmergencyAlert] = Field(default_factory=list, description="Emergency alerts")
-    red_flags: List[Dict[str, Any]] = Field(default_factory=list, description="Red flag symptoms")
-    completion_status: Dict[str, Any] = Field(..., description="Data completeness metrics")
+    started_at: int
+    updated_at: Optional[int] = None
+    expires_at: Optional[int] = None
 
 
 class EmergencyStatus(BaseModel):
     """Emergency status response."""
-    session_id: str = Field(..., description="Session identifier")
-    emergency_level: str = Field(..., description="Current emergency level")
-    red_flags: List[Dict[str, Any]] = Field(..., description="Detected red flags")
-    emergency_alerts: List[EmergencyAlert] = Field(..., description="Emergency alerts")
-    requires_immediate_care: bool = Field(..., description="Whether immediate care needed")
-    recommendation: str = Field(..., description="Recommended action")
-
-
-class DataCompleteness(BaseModel):
-    """Data completeness metrics."""
-    overall_percentage: float = Field(..., ge=0, le=100, description="Overall completion percentage")
-    collected_fields: List[str] = Field(..., description="Successfully collected fields")
-    missing_fields: List[str] = Field(..., description="Missing required fields")
-    symptoms_collected: int = Field(..., description="Number of symptoms collected")
-    oldcarts_completeness: float = Field(..., ge=0, le=100, description="OLDCARTS completion percentage")
-
-
-class ValidationError(BaseModel):
-    """Validation error details."""
-    field: str = Field(..., description="Field that failed validation")
-    message: str = Field(..., description="Error message")
-    value: Optional[str] = Field(None, description="Invalid value provided")
-    expected_format: Optional[str] = Field(None, description="Expected format or values")
-
-
-class MedicalConsultationResponse(BaseModel):
-    """Complete medical consultation response."""
-    session_summary: SessionStatus = Field(..., description="Session status")
-    medical_data: MedicalHistory = Field(..., description="Collected medical history")
-    symptoms: List[SymptomData] = Field(..., description="Symptom details")
-    vitals: Optional[VitalSigns] = Field(None, description="Vital signs")
-    ros: Optional[ReviewOfSystems] = Field(None, description="Review of systems")
-    emergency_status: EmergencyStatus = Field(..., description="Emergency assessment")
-    completeness: DataCompleteness = Field(..., description="Data completeness")
-    
-    # Clinical recommendations
-    recommended_specialty: Optional[str] = Field(None, description="Recommended medical specialty")
-    urgency_level: str = Field(..., description="Urgency level for care")
-    next_steps: List[str] = Field(..., description="Recommended next steps")
-
+    model_config = RESPONSE_MODEL_CONFIG
 
-# Legacy compatibility
-class StartSessionResponse(ChatResponse):
-    """Backward compatibility for start session response."""
-    pass
+    session_id: str
+    emergency_level: EmergencyLevel
+    red_flags: List[Dict[str, Any]]
+    emergency_alerts: List[EmergencyAlert]
+    requires_immediate_care: bool
+    recommendation: str
 
 
 class SessionStatusResponse(BaseModel):
     """Response model for session status endpoint."""
-    session_id: str = Field(..., description="Session identifier")
-    status: str = Field(..., description="Session status")
-    current_phase: str = Field(..., description="Current conversation phase")
-    emergency_level: str = Field(..., description="Emergency level")
-    message_count: int = Field(..., description="Total message count")
-    fields_collected: int = Field(..., description="Number of fields collected")
-    collected_data: Dict[str, Any] = Field(..., description="Collected medical data")
-    conversation_complete: bool = Field(..., description="Whether conversation is complete")
-    created_at: str = Field(..., description="Session creation timestamp")
-    updated_at: str = Field(..., description="Last update timestamp")
-
-
-class AICapabilitiesResponse(BaseModel):
-    """Response model for AI capabilities endpoint."""
-    agent_name: str = Field(..., description="Name of the AI agent")
-    version: str = Field(..., description="Agent version")
-    architecture: str = Field(..., description="System architecture")
-    individual_agents: List[str] = Field(..., description="List of individual agent capabilities")
-    flow: str = Field(..., description="Agent flow description")
-    capabilities: List[str] = Field(..., description="System capabilities")
-    langgraph_features: List[str] = Field(..., description="LangGraph specific features") 
\ No newline at end of file
+    model_config = RESPONSE_MODEL_CONFIG
+
+    session_id: str
+    status: str
+    current_phase: str
+    emergency_level: EmergencyLevel
+    message_count: int
+    fields_collected: int
+    collected_data: Dict[str, Any]
+    conversation_complete: bool
+    created_at: str
+    updated_at: str
+
+
+# Reusable validators for list payloads, built once at import
+_CONV_HISTORY_ADAPTER = TypeAdapter(List[ConversationMessage])
+_SYMPTOMS_ADAPTER = TypeAdapter(List[SymptomData])
+_RED_FLAGS_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+CHAT_REQUEST_ADAPTER = TypeAdapter(ChatRequest)
+CHAT_RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
+
+
+def decode_chat_request(raw: bytes) -> ChatRequest:
+    """Validate a raw JSON chat request body in a single pass."""
+    return CHAT_REQUEST_ADAPTER.validate_json(raw)
+
+
+def encode_chat_response(response: ChatResponse) -> bytes:
+    """Serialize a chat response straight to JSON bytes."""
+    return CHAT_RESPONSE_ADAPTER.dump_json(response)
+
+
+def validate_history(raw: List[Dict[str, Any]]) -> List[ConversationMessage]:
+    """Validate a raw conversation history without building a parent model."""
+    return _CONV_HISTORY_ADAPTER.validate_python(raw)
+
+
+def dump_history(messages: List[ConversationMessage]) -> List[Dict[str, Any]]:
+    """Serialize conversation messages to JSON-compatible dicts."""
+    return _CONV_HISTORY_ADAPTER.dump_python(messages, mode="json")
+
+
+def validate_symptoms(raw: List[Dict[str, Any]]) -> List[SymptomData]:
+    """Validate a raw list of symptoms."""
+    return _SYMPTOMS_ADAPTER.validate_python(raw)
+
+
+def validate_symptom_batch(raw: List[Dict[str, Any]]) -> SymptomBatch:
+    """Validate a raw list of symptoms and pack it for batch scans."""
+    return SymptomBatch.from_symptoms(_SYMPTOMS_ADAPTER.validate_python(raw))
+
+
+def validate_red_flags(raw: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate a raw list of red flags."""
+    return _RED_FLAGS_ADAPTER.validate_python(raw)
+
+
+# Models moved to schemas_extended, still importable from here
+_EXTENDED_MODELS = frozenset({
+    "FamilyHistory",
+    "SubstanceUse",
+    "MedicalHistory",
+    "VitalSigns",
+    "ROSFindings",
+    "ReviewOfSystems",
+    "DataCompleteness",
+    "SessionInfo",
+    "DetailedSessionSummary",
+    "ValidationError",
+    "MedicalConsultationResponse",
+    "StartSessionResponse",
+    "AICapabilitiesResponse",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXTENDED_MODELS:
+        from . import schemas_extended
+        return getattr(schemas_extended, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
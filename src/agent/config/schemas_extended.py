@@ -0,0 +1,164 @@
+"""Extended Pydantic schemas for full consultation summaries.
+
+These models are not needed on the chat hot path, so ``agent.config`` loads this
+module lazily on first use instead of at startup.
+"""
+
+from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
+
+from .schemas import (
+    RESPONSE_MODEL_CONFIG,
+    ChatResponse,
+    EmergencyAlert,
+    EmergencyLevel,
+    EmergencyStatus,
+    SessionStatus,
+    SymptomData,
+)
+
+
+class FamilyHistory(BaseModel):
+    """Conditions reported for close relatives."""
+    mother: List[str] = Field(default_factory=list)
+    father: List[str] = Field(default_factory=list)
+    siblings: List[str] = Field(default_factory=list)
+    children: List[str] = Field(default_factory=list)
+    grandparents: List[str] = Field(default_factory=list)
+
+
+class SubstanceUse(BaseModel):
+    """Substance use beyond smoking and alcohol."""
+    recreational_drugs: List[str] = Field(default_factory=list)
+    frequency: Optional[str] = None
+    last_use: Optional[str] = None
+
+
+class MedicalHistory(BaseModel):
+    """Comprehensive medical history data."""
+    # Demographics
+    age: Optional[int] = Field(None, ge=0, le=150)
+    birth_sex: Optional[str] = None
+    
+    # Medical background
+    chronic_conditions: List[str] = Field(default_factory=list)
+    current_medications: List[str] = Field(default_factory=list)
+    allergies: List[str] = Field(default_factory=list)
+    past_surgeries: List[str] = Field(default_factory=list)
+    hospitalizations: List[str] = Field(default_factory=list)
+    
+    # Family history
+    family_history: Optional[FamilyHistory] = None
+    
+    # Social history
+    smoking_status: Optional[str] = None
+    alcohol_use: Optional[str] = None
+    substance_use: Optional[SubstanceUse] = None
+    occupation: Optional[str] = None
+
+
+class VitalSigns(BaseModel):
+    """Vital signs and measurements."""
+    blood_pressure_systolic: Optional[int] = Field(None, ge=50, le=250)
+    blood_pressure_diastolic: Optional[int] = Field(None, ge=30, le=150)
+    heart_rate: Optional[int] = Field(None, ge=30, le=220)
+    temperature: Optional[float] = Field(None, ge=90.0, le=110.0)
+    height: Optional[float] = Field(None, ge=50.0, le=300.0)
+    weight: Optional[float] = Field(None, ge=10.0, le=500.0)
+
+
+# Findings for one body system, keyed by symptom (e.g. {"fever": True, "fatigue": False})
+ROSFindings = Dict[str, bool]
+
+
+class ReviewOfSystems(BaseModel):
+    """Review of Systems (ROS) data."""
+    general: Optional[ROSFindings] = None
+    cardiovascular: Optional[ROSFindings] = None
+    respiratory: Optional[ROSFindings] = None
+    gastrointestinal: Optional[ROSFindings] = None
+    genitourinary: Optional[ROSFindings] = None
+    musculoskeletal: Optional[ROSFindings] = None
+    neurological: Optional[ROSFindings] = None
+    dermatologic: Optional[ROSFindings] = None
+    psychiatric: Optional[ROSFindings] = None
+    endocrine: Optional[ROSFindings] = None
+    hematologic: Optional[ROSFindings] = None
+
+
+class DataCompleteness(BaseModel):
+    """Data completeness metrics."""
+    overall_percentage: float = Field(..., ge=0, le=100)
+    collected_fields: List[str]
+    missing_fields: List[str]
+    symptoms_collected: int
+    oldcarts_completeness: float = Field(..., ge=0, le=100)
+
+
+class SessionInfo(TypedDict, total=False):
+    """Session metadata included in a consultation summary."""
+    session_id: str
+    status: str
+    current_phase: str
+    emergency_level: EmergencyLevel
+    started_at: str
+    updated_at: Optional[str]
+    completed_at: Optional[str]
+
+
+class DetailedSessionSummary(BaseModel):
+    """Detailed medical consultation summary."""
+    model_config = RESPONSE_MODEL_CONFIG
+
+    session_info: SessionInfo
+    patient_data: MedicalHistory
+    symptoms: List[SymptomData] = Field(default_factory=list)
+    emergency_alerts: List[EmergencyAlert] = Field(default_factory=list)
+    red_flags: List[Dict[str, Any]] = Field(default_factory=list)
+    completion_status: DataCompleteness
+
+
+class ValidationError(BaseModel):
+    """Validation error details."""
+    field: str
+    message: str
+    value: Optional[str] = None
+    expected_format: Optional[str] = None
+
+
+class MedicalConsultationResponse(BaseModel):
+    """Complete medical consultation response."""
+    model_config = RESPONSE_MODEL_CONFIG
+
+    session_summary: SessionStatus
+    medical_data: MedicalHistory
+    symptoms: List[SymptomData]
+    vitals: Optional[VitalSigns] = None
+    ros: Optional[ReviewOfSystems] = None
+    emergency_status: EmergencyStatus
+    completeness: DataCompleteness
+    
+    # Clinical recommendations
+    recommended_specialty: Optional[str] = None
+    urgency_level: str
+    next_steps: List[str] = Field(default_factory=list)
+
+
+# Legacy compatibility
+class StartSessionResponse(ChatResponse):
+    """Backward compatibility for start session response."""
+    pass
+
+
+class AICapabilitiesResponse(BaseModel):
+    """Response model for AI capabilities endpoint."""
+    model_config = RESPONSE_MODEL_CONFIG
+
+    agent_name: str
+    version: str
+    architecture: str
+    individual_agents: List[str]
+    flow: str
+    capabilities: List[str]
+    langgraph_features: List[str]
@@ -0,0 +1,343 @@
+"""OpenAPI documentation overlay for the API schemas.
+
+Field descriptions and examples live here instead of on the Pydantic ``Field()``
+objects, so the runtime models only carry validation. ``apply_openapi_overlay``
+merges them into the generated OpenAPI document once, at startup.
+"""
+
+from typing import Any, Dict
+
+# Shared by UserMessage, AssistantMessage and SystemMessage
+_HISTORY_MESSAGE_DOCS: Dict[str, Any] = {
+    "properties": {
+        "content": {"description": "Message content"},
+        "timestamp": {"description": "Message timestamp in ISO format"},
+        "phase": {"description": "Conversation phase when message was sent"},
+    },
+}
+
+SCHEMA_DOCS: Dict[str, Dict[str, Any]] = {
+    "UserCreate": {
+        "properties": {
+            "user_id": {"description": "Unique identifier for the user"},
+        },
+    },
+    "ConversationStart": {
+        "properties": {
+            "user_id": {"description": "Unique user identifier"},
+            "patient_metadata": {"description": "Optional patient metadata"},
+        },
+    },
+    "SessionStartResponse": {
+        "properties": {
+            "kind": {"description": "Payload discriminator, always 'start'"},
+            "session_id": {"description": "Unique session identifier"},
+            "first_prompt": {"description": "Initial prompt for the user"},
+            "conversation_id": {"description": "Database conversation ID"},
+        },
+    },
+    "SessionResumeResponse": {
+        "properties": {
+            "kind": {"description": "Payload discriminator, always 'resume'"},
+            "session_id": {"description": "Session identifier"},
+            "last_message": {"description": "Last message to continue from"},
+            "current_node": {"description": "Current conversation node"},
+            "conversation_id": {"description": "Database conversation ID"},
+        },
+    },
+    "MessageIn": {
+        "properties": {
+            "role": {"description": "Message role (user or assistant)"},
+            "content": {"description": "Message content"},
+        },
+    },
+    "MessageOut": {
+        "properties": {
+            "role": {"description": "Message role"},
+            "content": {"description": "Message content"},
+            "timestamp_ms": {"description": "Message timestamp (epoch ms)"},
+            "is_system": {"description": "Whether this is a system message"},
+        },
+    },
+    "ChatRequest": {
+        "properties": {
+            "user_id": {"description": "Unique identifier for the user", "example": "user_123"},
+            "message": {"description": "User's message (empty for initial greeting)", "example": "I am 25 years old"},
+            "session_id": {"description": "Session ID for continuing conversation (empty for new session)", "example": "vi_dynamic_20250616_123456_789"},
+        },
+        "examples": [
+            {
+                "summary": "Start new conversation",
+                "description": "Start a new conversation with empty message to get greeting",
+                "value": {
+                    "user_id": "user_123",
+                    "message": "",
+                    "session_id": "",
+                },
+            },
+            {
+                "summary": "Provide age",
+                "description": "Continue conversation by providing age",
+                "value": {
+                    "user_id": "user_123",
+                    "message": "I am 25 years old",
+                    "session_id": "vi_dynamic_20250616_123456_789",
+                },
+            },
+            {
+                "summary": "Comprehensive symptom description",
+                "description": "Provide detailed symptom information",
+                "value": {
+                    "user_id": "user_123",
+                    "message": "I have severe headaches on the right side of my head that started 3 days ago. They are throbbing and 8/10 in pain. Light makes them worse.",
+                    "session_id": "vi_dynamic_20250616_123456_789",
+                },
+            },
+            {
+                "summary": "Emergency scenario",
+                "description": "Emergency chest pain scenario",
+                "value": {
+                    "user_id": "user_123",
+                    "message": "I am a 45-year-old male with severe crushing chest pain that started 1 hour ago. The pain radiates to my left arm and is 9/10 severity. I also have shortness of breath and nausea.",
+                    "session_id": "",
+                },
+            },
+        ],
+    },
+    "UserMessage": _HISTORY_MESSAGE_DOCS,
+    "AssistantMessage": _HISTORY_MESSAGE_DOCS,
+    "SystemMessage": _HISTORY_MESSAGE_DOCS,
+    "AIContext": {
+        "properties": {
+            "last_agent_action": {"description": "Last action performed by an agent"},
+            "last_extraction": {"description": "Details of the last extraction attempt"},
+            "orchestrator_reasoning": {"description": "Orchestrator's reasoning for routing decisions"},
+            "current_field": {"description": "Current field being collected"},
+            "completion_readiness": {"description": "Completion readiness score (0.0-1.0)"},
+        },
+    },
+    "OldcartsProgress": {
+        "properties": {
+            "age": {"description": "Age collection status", "example": "✅"},
+            "biological_sex": {"description": "Biological sex collection status", "example": "✅"},
+            "primary_complaint": {"description": "Primary complaint collection status", "example": "❌"},
+            "onset": {"description": "Onset collection status", "example": "❌"},
+            "location": {"description": "Location collection status", "example": "❌"},
+            "duration": {"description": "Duration collection status", "example": "❌"},
+            "character": {"description": "Character collection status", "example": "❌"},
+            "severity": {"description": "Severity collection status", "example": "❌"},
+        },
+    },
+    "Summary": {
+        "properties": {
+            "total_fields_possible": {"description": "Total number of fields that can be collected", "example": 15},
+            "fields_completed": {"description": "Number of fields successfully collected", "example": 3},
+            "completion_percentage": {"description": "Completion percentage", "example": 20.0},
+        },
+    },
+    "ChatResponse": {
+        "properties": {
+            "session_id": {"description": "Session identifier", "example": "vi_dynamic_20250616_123456_789"},
+            "message": {"description": "AI assistant's response message", "example": "Hello! I'm Vi, your virtual health assistant..."},
+            "conversation_complete": {"description": "Whether the conversation is complete", "example": False},
+            "collected_data": {"description": "All collected medical data", "example": {'age': '25', 'biological_sex': 'Female'}},
+            "fields_collected": {"description": "Number of fields collected", "example": 2},
+            "next_field": {"description": "Next field to collect", "example": "primary_complaint"},
+            "current_section": {"description": "Current conversation section", "example": "collecting_primary_complaint"},
+            "completion_readiness": {"description": "Completion readiness score (0.0-1.0)", "example": 0.2},
+            "emergency_level": {"description": "Emergency triage level", "example": "NONE"},
+            "conversation_history": {"description": "Complete conversation history"},
+            "total_messages": {"description": "Total number of messages in conversation", "example": 4},
+            "ai_context": {"description": "AI agent context and reasoning"},
+            "oldcarts_progress": {"description": "OLDCARTS field collection progress"},
+            "summary": {"description": "Conversation summary statistics"},
+        },
+    },
+    "SessionStartRequest": {
+        "properties": {
+            "user_id": {"description": "Unique user identifier"},
+            "patient_metadata": {"description": "Optional patient metadata"},
+        },
+    },
+    "EmergencyAlert": {
+        "properties": {
+            "alert_id": {"description": "Unique alert identifier"},
+            "severity": {"description": "Emergency severity level"},
+            "trigger_symptoms": {"description": "Symptoms that triggered the alert"},
+            "recommendation": {"description": "Recommended action"},
+            "timestamp_ms": {"description": "When alert was created (epoch ms)"},
+        },
+    },
+    "SymptomData": {
+        "properties": {
+            "name": {"description": "Symptom name"},
+            "is_primary": {"description": "Whether this is the primary complaint"},
+            "onset": {"description": "When symptom started"},
+            "location": {"description": "Where symptom is located"},
+            "duration": {"description": "Duration pattern of symptom"},
+            "character": {"description": "Character/quality of symptom"},
+            "aggravating_factors": {"description": "What makes it worse"},
+            "relieving_factors": {"description": "What makes it better"},
+            "timing": {"description": "Timing patterns"},
+            "severity": {"description": "Severity on 1-10 scale"},
+            "radiation": {"description": "Does it spread/radiate"},
+            "progression": {"description": "How symptom has changed"},
+            "associated_symptoms": {"description": "Related symptoms"},
+            "similar_episodes": {"description": "Past similar episodes"},
+            "treatments_tried": {"description": "Treatments attempted"},
+            "oldcarts_completion": {"description": "OLDCARTS completion status"},
+        },
+    },
+    "MedicalHistory": {
+        "properties": {
+            "age": {"description": "Patient age"},
+            "birth_sex": {"description": "Biological sex assigned at birth"},
+            "chronic_conditions": {"description": "Chronic medical conditions"},
+            "current_medications": {"description": "Current medications"},
+            "allergies": {"description": "Known allergies"},
+            "past_surgeries": {"description": "Previous surgeries"},
+            "hospitalizations": {"description": "Past hospitalizations"},
+            "family_history": {"description": "Family medical history"},
+            "smoking_status": {"description": "Smoking status"},
+            "alcohol_use": {"description": "Alcohol use pattern"},
+            "substance_use": {"description": "Substance use history"},
+            "occupation": {"description": "Occupation"},
+        },
+    },
+    "VitalSigns": {
+        "properties": {
+            "blood_pressure_systolic": {"description": "Systolic BP"},
+            "blood_pressure_diastolic": {"description": "Diastolic BP"},
+            "heart_rate": {"description": "Heart rate (BPM)"},
+            "temperature": {"description": "Temperature (F)"},
+            "height": {"description": "Height (cm)"},
+            "weight": {"description": "Weight (kg)"},
+        },
+    },
+    "ReviewOfSystems": {
+        "properties": {
+            "general": {"description": "General symptoms"},
+            "cardiovascular": {"description": "Cardiovascular symptoms"},
+            "respiratory": {"description": "Respiratory symptoms"},
+            "gastrointestinal": {"description": "GI symptoms"},
+            "genitourinary": {"description": "GU symptoms"},
+            "musculoskeletal": {"description": "Musculoskeletal symptoms"},
+            "neurological": {"description": "Neurological symptoms"},
+            "dermatologic": {"description": "Skin symptoms"},
+            "psychiatric": {"description": "Mental health symptoms"},
+            "endocrine": {"description": "Endocrine symptoms"},
+            "hematologic": {"description": "Blood-related symptoms"},
+        },
+    },
+    "SessionStatus": {
+        "properties": {
+            "session_id": {"description": "Session identifier"},
+            "status": {"description": "Session status"},
+            "current_node": {"description": "Current conversation node"},
+            "current_phase": {"description": "Current medical phase"},
+            "emergency_level": {"description": "Current emergency level"},
+            "red_flags": {"description": "Detected red flags"},
+            "symptoms_queue": {"description": "Symptoms queued for processing"},
+            "processed_symptoms": {"description": "Completed symptoms"},
+            "symptoms_collected": {"description": "Number of symptoms collected"},
+            "emergency_alerts": {"description": "Number of emergency alerts"},
+            "variables": {"description": "Collected variables"},
+            "started_at": {"description": "Session start time (epoch ms)"},
+            "updated_at": {"description": "Last update time (epoch ms)"},
+            "expires_at": {"description": "Session expiration time (epoch ms)"},
+        },
+    },
+    "DataCompleteness": {
+        "properties": {
+            "overall_percentage": {"description": "Overall completion percentage"},
+            "collected_fields": {"description": "Successfully collected fields"},
+            "missing_fields": {"description": "Missing required fields"},
+            "symptoms_collected": {"description": "Number of symptoms collected"},
+            "oldcarts_completeness": {"description": "OLDCARTS completion percentage"},
+        },
+    },
+    "DetailedSessionSummary": {
+        "properties": {
+            "session_info": {"description": "Session metadata"},
+            "patient_data": {"description": "Patient demographic and medical data"},
+            "symptoms": {"description": "Collected symptoms"},
+            "emergency_alerts": {"description": "Emergency alerts"},
+            "red_flags": {"description": "Red flag symptoms"},
+            "completion_status": {"description": "Data completeness metrics"},
+        },
+    },
+    "EmergencyStatus": {
+        "properties": {
+            "session_id": {"description": "Session identifier"},
+            "emergency_level": {"description": "Current emergency level"},
+            "red_flags": {"description": "Detected red flags"},
+            "emergency_alerts": {"description": "Emergency alerts"},
+            "requires_immediate_care": {"description": "Whether immediate care needed"},
+            "recommendation": {"description": "Recommended action"},
+        },
+    },
+    "ValidationError": {
+        "properties": {
+            "field": {"description": "Field that failed validation"},
+            "message": {"description": "Error message"},
+            "value": {"description": "Invalid value provided"},
+            "expected_format": {"description": "Expected format or values"},
+        },
+    },
+    "MedicalConsultationResponse": {
+        "properties": {
+            "session_summary": {"description": "Session status"},
+            "medical_data": {"description": "Collected medical history"},
+            "symptoms": {"description": "Symptom details"},
+            "vitals": {"description": "Vital signs"},
+            "ros": {"description": "Review of systems"},
+            "emergency_status": {"description": "Emergency assessment"},
+            "completeness": {"description": "Data completeness"},
+            "recommended_specialty": {"description": "Recommended medical specialty"},
+            "urgency_level": {"description": "Urgency level for care"},
+            "next_steps": {"description": "Recommended next steps"},
+        },
+    },
+    "SessionStatusResponse": {
+        "properties": {
+            "session_id": {"description": "Session identifier"},
+            "status": {"description": "Session status"},
+            "current_phase": {"description": "Current conversation phase"},
+            "emergency_level": {"description": "Emergency level"},
+            "message_count": {"description": "Total message count"},
+            "fields_collected": {"description": "Number of fields collected"},
+            "collected_data": {"description": "Collected medical data"},
+            "conversation_complete": {"description": "Whether conversation is complete"},
+            "created_at": {"description": "Session creation timestamp"},
+            "updated_at": {"description": "Last update timestamp"},
+        },
+    },
+    "AICapabilitiesResponse": {
+        "properties": {
+            "agent_name": {"description": "Name of the AI agent"},
+            "version": {"description": "Agent version"},
+            "architecture": {"description": "System architecture"},
+            "individual_agents": {"description": "List of individual agent capabilities"},
+            "flow": {"description": "Agent flow description"},
+            "capabilities": {"description": "System capabilities"},
+            "langgraph_features": {"description": "LangGraph specific features"},
+        },
+    },
+}
+
+
+def apply_openapi_overlay(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge SCHEMA_DOCS into the component schemas of a generated OpenAPI document."""
+    components = openapi_schema.get("components", {}).get("schemas", {})
+    for name, docs in SCHEMA_DOCS.items():
+        target = components.get(name)
+        if target is None:
+            continue
+        properties = target.get("properties", {})
+        for field_name, field_docs in docs.get("properties", {}).items():
+            if field_name in properties:
+                properties[field_name].update(field_docs)
+        for key, value in docs.items():
+            if key != "properties":
+                target[key] = value
+    return openapi_schema
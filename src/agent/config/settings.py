@@ -0,0 +1,64 @@
+"""Configuration settings for the AI clinic application.
+
+Use ``get_settings()`` to obtain the process-wide ``Settings`` instance;
+environment variables are read once, the first time it is called.
+"""
+
+import os
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# slots=True is only accepted by dataclass() on Python 3.10+
+_DATACLASS_OPTIONS = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+
+def _env(name: str, default: Optional[str] = None):
+    """Read an environment variable when a Settings instance is created."""
+    return field(default_factory=lambda: os.environ.get(name, default))
+
+
+def _env_int(name: str, default: int):
+    """Read an integer environment variable when a Settings instance is created."""
+    return field(default_factory=lambda: int(os.environ.get(name, default)))
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Settings:
+    """Application settings."""
+
+    # Database
+    DATABASE_URL: str = _env("DATABASE_URL", "sqlite:///./ai_clinic.db")
+    DB_POOL_SIZE: int = _env_int("DB_POOL_SIZE", 20)
+    DB_MAX_OVERFLOW: int = _env_int("DB_MAX_OVERFLOW", 30)
+    DB_POOL_TIMEOUT: int = _env_int("DB_POOL_TIMEOUT", 30)
+    DB_POOL_RECYCLE: int = _env_int("DB_POOL_RECYCLE", 1800)
+    SQL_SLOW_MS: int = _env_int("SQL_SLOW_MS", 50)  # Log statements slower than this; 0 disables
+
+    # OpenAI
+    OPENAI_API_KEY: Optional[str] = _env("OPENAI_API_KEY")
+
+    # Server
+    HOST: str = _env("HOST", "0.0.0.0")
+    PORT: int = _env_int("PORT", 8000)
+
+    # LangGraph
+    LANGGRAPH_API_URL: str = _env("LANGGRAPH_API_URL", "http://localhost:8123")
+
+    # CORS: comma-separated browser origins allowed to call the API ("*" allows any)
+    CORS_ORIGINS: str = _env("CORS_ORIGINS", "http://localhost:3000,http://localhost:8000")
+
+    @property
+    def cors_origins(self) -> Tuple[str, ...]:
+        """CORS_ORIGINS split into individual origins."""
+        return tuple(origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip())
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached application settings (``get_settings.cache_clear()`` to reload)."""
+    return Settings()
+
+
+settings = get_settings()
@@ -4,40 +4,73 @@
 A streamlined medical consultation API powered by LangGraph AI agent.
 """
 
-import os
 from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+import logging
+import os
 from contextlib import asynccontextmanager
 
-from .config.database import engine, Base
+import orjson
+
+from .config.database import async_engine, create_tables
+from .config.openai_client import close_openai_clients, get_openai_async_client, warm_openai_clients
+from .config.schemas_openapi import apply_openapi_overlay
+from .config.settings import get_settings
+from .middleware import FastCORS, HealthShortCircuit, StreamingAwareGZip
+from .responses import ORJSONResponse
 from .routers.medical import router as medical_router
 
 
+logger = logging.getLogger(__name__)
+
+
+# Liveness payload, encoded once and served by HealthShortCircuit without touching the router
+HEALTH_STATUS = {
+    "status": "healthy",
+    "service": "AI Medical Assistant",
+    "version": "2.0.0",
+    "langgraph": "enabled"
+}
+HEALTH_BODY = orjson.dumps(HEALTH_STATUS)
+
+# 500 body with only the detail filled in per error
+_ERROR_BODY_PREFIX = b'{"error":"Internal server error","status_code":500,"detail":'
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management."""
     # Startup
-    print("🚀 Starting AI Medical Assistant...")
+    logger.info("🚀 Starting AI Medical Assistant...")
     
     # Create database tables
     try:
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created/verified")
+        await create_tables()
+        logger.info("✅ Database tables created/verified")
     except Exception as e:
-        print(f"❌ Database error: {e}")
+        logger.error("❌ Database error: %s", e)
     
     # Verify OpenAI API key
-    if not os.getenv("OPENAI_API_KEY"):
-        print("⚠️  Warning: OPENAI_API_KEY not set")
+    if not get_settings().OPENAI_API_KEY:
+        logger.warning("⚠️  OPENAI_API_KEY not set")
     else:
-        print("✅ OpenAI API key configured")
+        logger.info("✅ OpenAI API key configured")
+    
+    # Open the shared OpenAI connection pools now so the first chat request skips the TLS handshake
+    app.state.oai_client = get_openai_async_client()
+    await warm_openai_clients(get_settings().OPENAI_API_KEY)
+    
+    # Build the OpenAPI document up front so the first /docs hit doesn't pay for it
+    app.openapi()
     
-    print("🏥 AI Medical Assistant ready!")
+    logger.info("🏥 AI Medical Assistant ready!")
     
     yield
     
     # Shutdown
-    print("👋 Shutting down AI Medical Assistant...")
+    logger.info("👋 Shutting down AI Medical Assistant...")
+    await async_engine.dispose()
+    await close_openai_clients()
 
 
 # Create FastAPI application
@@ -70,13 +103,20 @@ app = FastAPI(
         "name": "MIT License",
         "url": "https://opensource.org/licenses/MIT"
     },
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Compress JSON bodies of 1KB and up (OLDCARTS data, summaries); event streams are left alone
+app.add_middleware(StreamingAwareGZip, minimum_size=1000, compresslevel=5)
+
+# Liveness probes are answered ahead of routing; CORS still wraps them for browser callers
+app.add_middleware(HealthShortCircuit, body=HEALTH_BODY)
+
 # CORS middleware
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    FastCORS,
+    allow_origins=get_settings().cors_origins,  # Set CORS_ORIGINS per deployment
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -86,27 +126,52 @@ app.add_middleware(
 app.include_router(medical_router, prefix="/api")
 
 
+def custom_openapi():
+    """Generate the OpenAPI schema once, with field docs merged in from the overlay."""
+    if app.openapi_schema is None:
+        app.openapi_schema = apply_openapi_overlay(FastAPI.openapi(app))
+    return app.openapi_schema
+
+
+app.openapi = custom_openapi
+
+
 @app.get("/health")
 async def health_check():
-    """System health check."""
-    return {
-        "status": "healthy",
-        "service": "AI Medical Assistant",
-        "version": "2.0.0",
-        "langgraph": "enabled"
-    }
+    """System health check (served by HealthShortCircuit; the route documents it in OpenAPI)."""
+    return HEALTH_STATUS
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    return {
-        "error": "Internal server error",
-        "detail": str(exc),
-        "status_code": 500
-    }
+    return Response(
+        content=_ERROR_BODY_PREFIX + orjson.dumps(str(exc)) + b"}",
+        status_code=500,
+        media_type="application/json"
+    )
 
 
 if __name__ == "__main__":
+    import copy
+    
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    from uvicorn.config import LOGGING_CONFIG
+    
+    # Startup banner lines are INFO; LOG_LEVEL=INFO shows them, the WARNING default keeps production quiet.
+    # Configured through uvicorn so every worker process applies it, and importers keep their own setup.
+    log_config = copy.deepcopy(LOGGING_CONFIG)
+    log_config["root"] = {"handlers": ["default"], "level": os.getenv("LOG_LEVEL", "WARNING").upper()}
+    
+    # uvloop + httptools come with uvicorn[standard]; reload is dev-only (DEV=1) and ignores workers
+    settings = get_settings()
+    uvicorn.run(
+        "agent.main:app",
+        host=settings.HOST,
+        port=settings.PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+        reload=os.getenv("DEV") == "1",
+        log_config=log_config
+    )
@@ -5,14 +5,22 @@ Contains all agent-related functions for the multi-agent medical conversation sy
 Handles agent execution, context preparation, response processing, and routing logic.
 """
 
-import json
-from typing import Any, Dict, List
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 
+import orjson
 from langchain_core.messages import SystemMessage, AIMessage, HumanMessage
 from langchain_openai import ChatOpenAI
 
-from .states import ViState, AgentStep
+from .states import ViState, AgentStep, MessageTally
 from .prompts import AGENT_SYSTEM_PROMPTS
 
 # Fix imports to use absolute imports
@@ -21,6 +29,168 @@ try:
 except ImportError:
     from ..config.models import EmergencyLevel
 
+logger = logging.getLogger(__name__)
+
+# Core fields the extraction agent works through, in asking order
+REQUIRED_FIELDS = ("age", "biological_sex", "primary_complaint", "onset", "location", "duration", "character", "severity")
+
+# Completion summary layout: section -> the collected fields shown in it
+OLDCARTS_SECTIONS = (
+    ("patient_context", ("age", "biological_sex")),
+    ("chief_complaint", ("primary_complaint", "onset", "location")),
+    ("symptom_details", ("character", "severity", "duration", "timing")),
+    ("modifying_factors", ("aggravating_factors", "relieving_factors")),
+    ("additional_information", ("radiation", "progression", "related_symptoms", "treatment_attempted")),
+)
+NOT_PROVIDED = "Not provided"
+# Field values that don't count as collected data (a tuple: collected values may be unhashable lists)
+_UNFILLED_VALUES = (NOT_PROVIDED, "unclear_response", "skipped_by_user")
+
+# Long conversations that are mostly complete are wrapped up automatically
+AUTO_COMPLETE_MIN_MESSAGES = 50
+AUTO_COMPLETE_MIN_READINESS = 0.6
+
+# JSON body of a ```json / ``` / ```JSON fenced block
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL | re.IGNORECASE)
+
+# Orchestrator "next_agent" spellings -> graph node names (the orchestrator can't route to itself)
+_AGENT_NAME_MAP = {
+    name: step.value
+    for step in AgentStep if step is not AgentStep.ORCHESTRATOR
+    for name in (step.name, step.value)
+}
+_AGENT_NAME_MAP.update({"END": "END", "end": "END"})
+
+# Words that suggest the user stated a severity; matched as substrings, like "8/10" or "severely"
+_SEVERITY_KEYWORDS = frozenset({
+    "severe", "mild", "moderate", "excruciating", "unbearable", "pain level", "scale", "out of 10", "/10"
+})
+_SEVERITY_RE = re.compile("|".join(map(re.escape, sorted(_SEVERITY_KEYWORDS))), re.IGNORECASE)
+
+# Agents whose replies are plain text generated from the context alone, so identical contexts can share them
+CACHEABLE_AGENTS = frozenset({AgentStep.GREETING_AGENT.value, AgentStep.QUESTION_AGENT.value})
+# Agents that reply with user-facing text rather than JSON
+STREAMED_AGENTS = frozenset({
+    AgentStep.GREETING_AGENT.value, AgentStep.QUESTION_AGENT.value,
+    AgentStep.COMPLETION_AGENT.value, AgentStep.EMERGENCY_AGENT.value,
+})
+RESPONSE_CACHE_SIZE = 2048
+RESPONSE_CACHE_TTL = float(os.getenv("VI_RESPONSE_CACHE_TTL", "3600"))
+
+
+class _ResponseCache:
+    """Size-bounded, TTL-expiring map of context fingerprint -> agent reply, shared across sessions."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key: bytes, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_response_cache = _ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+
+def _response_cache_key(agent: str, context: Dict[str, Any]) -> bytes:
+    """Fingerprint an agent's context; greetings drop the session id so new sessions share one entry."""
+    if agent == AgentStep.GREETING_AGENT.value:
+        context = {k: v for k, v in context.items() if k != "session_id"}
+    payload = orjson.dumps([agent, context], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.sha256(payload).digest()
+
+
+def _message_relation(ai_count: int, user_count: int) -> str:
+    """Classify the AI vs user message counts for routing."""
+    if ai_count > user_count:
+        return "ai_gt_user"
+    if ai_count < user_count:
+        return "ai_lt_user"
+    return "empty" if ai_count == 0 else "ai_eq_user"
+
+
+def _route_decision(relation: str, next_step: str, question_asked: bool) -> str:
+    """Routing rules applied after the orchestrator picks ``next_step``."""
+    # Allow initial greeting even with no messages
+    if relation == "empty" and next_step == AgentStep.GREETING_AGENT.value:
+        return next_step
+    # Only force END if we've already processed the user's latest message
+    if relation == "ai_gt_user":
+        return "END"
+    # Extraction and evaluation still need to process the user's response when counts are equal
+    if next_step in (AgentStep.EXTRACTION_AGENT.value, AgentStep.EVALUATION_AGENT.value):
+        return next_step
+    # If we just asked a question and the user hasn't answered, we should wait for response
+    if question_asked and relation != "ai_lt_user":
+        return "END"
+    return next_step
+
+
+# (message relation, next_step, question just asked) -> destination, for every step the orchestrator can pick
+_ROUTE_TABLE = {
+    (relation, step, question_asked): _route_decision(relation, step, question_asked)
+    for relation in ("empty", "ai_eq_user", "ai_lt_user", "ai_gt_user")
+    for step in (*(agent.value for agent in AgentStep), "END")
+    for question_asked in (False, True)
+}
+
+
+def _strip_json_fence(response: str) -> str:
+    """Return the JSON inside a markdown code fence, or the response unchanged."""
+    match = _FENCE_RE.search(response)
+    return match.group(1) if match else response
+
+
+def _tally_messages(messages: List) -> MessageTally:
+    """Count AI/user messages and find the latest of each in a single pass."""
+    ai_count = user_count = 0
+    last_user = last_ai = ""
+    for msg in messages:
+        if isinstance(msg, AIMessage):
+            ai_count += 1
+            last_ai = msg.content
+        elif isinstance(msg, HumanMessage):
+            user_count += 1
+            last_user = msg.content
+    return MessageTally(len(messages), ai_count, user_count, last_user, last_ai)
+
+
+def _log_messages(messages: List, tally: MessageTally) -> None:
+    """Dump the conversation at DEBUG level; skipped entirely when DEBUG is off."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("🔍 Messages Debug: total=%d, ai=%d, user=%d", tally.total, tally.ai_count, tally.user_count)
+    for i, msg in enumerate(messages):
+        msg_type = "AI" if isinstance(msg, AIMessage) else "USER" if isinstance(msg, HumanMessage) else "OTHER"
+        logger.debug("  [%d] %s: %.50s", i, msg_type, msg.content)
+
+
+@lru_cache(maxsize=256)
+def _organize_collected_data(fields_json: bytes) -> Dict[str, Dict[str, Any]]:
+    """Group collected fields by OLDCARTS section, memoized on their canonical JSON (read-only result)."""
+    collected_fields = orjson.loads(fields_json)
+    return {
+        section: {field: collected_fields.get(field, NOT_PROVIDED) for field in fields}
+        for section, fields in OLDCARTS_SECTIONS
+    }
+
 
 class AgentFunctions:
     """Class containing all agent-related functions for the dynamic multi-agent system."""
@@ -30,39 +200,60 @@ class AgentFunctions:
         self.llm = llm
         self.db = db
     
-    def run_ai_agent(self, state: ViState) -> ViState:
+    async def run_ai_agent(self, state: ViState) -> ViState:
         """Run the appropriate AI agent based on current step."""
         current_agent = state.get("next_step", AgentStep.ORCHESTRATOR.value)
         
-        print(f"🤖 Running AI Agent: {current_agent}")
+        # The orchestrator prompt always sends a finished extraction to evaluation,
+        # so run evaluation in its place and skip that round trip
+        if (current_agent == AgentStep.ORCHESTRATOR.value
+                and state.get("ai_context", {}).get("last_agent_action") == "extraction_complete"):
+            logger.debug("⚡ Post-extraction: running evaluation directly instead of asking the orchestrator")
+            current_agent = AgentStep.EVALUATION_AGENT.value
+            state["next_step"] = current_agent
+        
+        logger.debug("🤖 Running AI Agent: %s", current_agent)
         
         # Get the system prompt for this agent
         system_prompt = AGENT_SYSTEM_PROMPTS.get(current_agent)
         if not system_prompt:
-            print(f"❌ No system prompt found for agent: {current_agent}")
+            logger.error("❌ No system prompt found for agent: %s", current_agent)
             return state
         
         # Prepare context for the agent
         context = self.prepare_agent_context(state, current_agent)
         
-        # Create messages for the LLM
+        # Create messages for the LLM - static system prompt first so it forms a cacheable prefix
         messages = [
             SystemMessage(content=system_prompt),
-            HumanMessage(content=json.dumps(context, indent=2))
+            HumanMessage(content=orjson.dumps(context, option=orjson.OPT_NON_STR_KEYS).decode())
         ]
         
+        cache_key = _response_cache_key(current_agent, context) if current_agent in CACHEABLE_AGENTS else None
+        
         try:
-            # Run the AI agent
-            response = self.llm.invoke(messages)
-            result = response.content.strip()
+            result = _response_cache.get(cache_key) if cache_key else None
+            if result is None:
+                # Run the AI agent; the per-agent cache key keeps each prompt on its own cached prefix
+                extra_body = {"prompt_cache_key": f"vi::{current_agent}"}
+                if current_agent in STREAMED_AGENTS:
+                    # Stream user-facing text so graph.astream(stream_mode="messages") sees tokens as they arrive
+                    chunks = [chunk.content async for chunk in self.llm.astream(messages, extra_body=extra_body)]
+                    result = "".join(chunks).strip()
+                else:
+                    # JSON decisions are only usable once complete; the parser skips surrounding whitespace
+                    response = await self.llm.ainvoke(messages, extra_body=extra_body)
+                    result = response.content
+                if cache_key:
+                    _response_cache.set(cache_key, result)
             
-            print(f"🧠 {current_agent} response: {result[:100]}...")
+            logger.debug("🧠 %s response: %.100s...", current_agent, result)
             
             # Process the agent's response
             state = self.process_agent_response(state, current_agent, result)
             
         except Exception as e:
-            print(f"❌ Error in {current_agent}: {e}")
+            logger.error("❌ Error in %s: %s", current_agent, e)
             # Fallback handling
             state = self.handle_agent_error(state, current_agent, str(e))
         
@@ -83,21 +274,17 @@ class AgentFunctions:
         if agent == AgentStep.ORCHESTRATOR.value:
             # Determine conversation state more accurately
             messages = state.get("messages", [])
-            has_ai_messages = any(isinstance(msg, AIMessage) for msg in messages)
-            has_user_messages = any(isinstance(msg, HumanMessage) for msg in messages)
+            tally = self.tally_messages(state)
+            ai_message_count = tally.ai_count
+            user_message_count = tally.user_count
+            has_ai_messages = ai_message_count > 0
+            has_user_messages = user_message_count > 0
             has_collected_data = bool(state.get("collected_fields", {}))
             last_user_message = self.get_last_user_message(state)
             last_agent_action = state.get("ai_context", {}).get("last_agent_action", "none")
             last_extraction = state.get("ai_context", {}).get("last_extraction")
             
-            # Count messages for better state detection
-            ai_message_count = len([msg for msg in messages if isinstance(msg, AIMessage)])
-            user_message_count = len([msg for msg in messages if isinstance(msg, HumanMessage)])
-            
-            print(f"🔍 Messages Debug: total={len(messages)}, ai={ai_message_count}, user={user_message_count}")
-            for i, msg in enumerate(messages):
-                msg_type = "AI" if isinstance(msg, AIMessage) else "USER" if isinstance(msg, HumanMessage) else "OTHER"
-                print(f"  [{i}] {msg_type}: {msg.content[:50]}...")
+            _log_messages(messages, tally)
             
             # Determine the actual conversation state
             if not has_ai_messages and not has_user_messages:
@@ -114,16 +301,20 @@ class AgentFunctions:
             # CRITICAL: Prevent infinite extraction loops
             if last_agent_action == "extraction_complete":
                 conversation_state = "extraction_complete_needs_evaluation"
-                print(f"🛡️ LOOP PREVENTION: Forcing evaluation after extraction complete")
+                logger.debug("🛡️ LOOP PREVENTION: Forcing evaluation after extraction complete")
             
-            print(f"🔍 Orchestrator Debug: ai_msgs={ai_message_count}, user_msgs={user_message_count}, last_action={last_agent_action}, state={conversation_state}")
+            logger.debug(
+                "🔍 Orchestrator Debug: ai_msgs=%d, user_msgs=%d, last_action=%s, state=%s",
+                ai_message_count, user_message_count, last_agent_action, conversation_state
+            )
             
             # AUTO-COMPLETION CHECK: If messages >= 50 and completion >= 60%
-            total_messages = len(messages)
-            completion_readiness = state.get("completion_readiness", 0.0)
-            
-            if total_messages >= 50 and completion_readiness >= 0.6:
-                print(f"🚀 AUTO-COMPLETION TRIGGERED: {total_messages} messages, {completion_readiness:.1f} completion")
+            auto_completion = self.auto_completion_check(state)
+            if auto_completion["should_auto_complete"]:
+                logger.info(
+                    "🚀 AUTO-COMPLETION TRIGGERED: %d messages, %.1f completion",
+                    auto_completion["total_messages"], auto_completion["completion_readiness"]
+                )
                 conversation_state = "auto_completion_triggered"
             
             base_context.update({
@@ -135,14 +326,10 @@ class AgentFunctions:
                 "has_collected_data": has_collected_data,
                 "ai_message_count": ai_message_count,
                 "user_message_count": user_message_count,
-                "total_messages": len(messages),
+                "total_messages": tally.total,
                 "last_agent_action": last_agent_action,
                 "last_extraction": last_extraction,
-                "auto_completion_check": {
-                    "total_messages": total_messages,
-                    "completion_readiness": completion_readiness,
-                    "should_auto_complete": total_messages >= 50 and completion_readiness >= 0.6
-                }
+                "auto_completion_check": auto_completion
             })
         
         elif agent == AgentStep.EXTRACTION_AGENT.value:
@@ -159,7 +346,7 @@ class AgentFunctions:
                 "user_response": user_response,
                 "target_field": current_field,
                 "collected_fields_so_far": collected_fields,
-                "fields_still_needed": [f for f in ["age", "biological_sex", "primary_complaint", "onset", "location", "duration", "character", "severity"] if f not in collected_fields]
+                "fields_still_needed": [f for f in REQUIRED_FIELDS if f not in collected_fields]
             })
         
         elif agent == AgentStep.EVALUATION_AGENT.value:
@@ -167,11 +354,7 @@ class AgentFunctions:
                 "total_fields_possible": 15,
                 "fields_collected": len(state.get("collected_fields", {})),
                 "last_extraction_result": state.get("ai_context", {}).get("last_extraction"),
-                "auto_completion_check": {
-                    "total_messages": len(state.get("messages", [])),
-                    "completion_readiness": state.get("completion_readiness", 0.0),
-                    "should_auto_complete": len(state.get("messages", [])) >= 50 and state.get("completion_readiness", 0.0) >= 0.6
-                }
+                "auto_completion_check": self.auto_completion_check(state)
             })
         
         elif agent == AgentStep.QUESTION_AGENT.value:
@@ -184,45 +367,22 @@ class AgentFunctions:
         elif agent == AgentStep.COMPLETION_AGENT.value:
             auto_completion_reason = state.get("ai_context", {}).get("auto_completion_reason")
             collected_fields = state.get("collected_fields", {})
+            tally = self.tally_messages(state)
             
             # Organize collected data for better summary generation
-            organized_data = {
-                "patient_context": {
-                    "age": collected_fields.get("age", "Not provided"),
-                    "biological_sex": collected_fields.get("biological_sex", "Not provided")
-                },
-                "chief_complaint": {
-                    "primary_complaint": collected_fields.get("primary_complaint", "Not provided"),
-                    "onset": collected_fields.get("onset", "Not provided"),
-                    "location": collected_fields.get("location", "Not provided")
-                },
-                "symptom_details": {
-                    "character": collected_fields.get("character", "Not provided"),
-                    "severity": collected_fields.get("severity", "Not provided"),
-                    "duration": collected_fields.get("duration", "Not provided"),
-                    "timing": collected_fields.get("timing", "Not provided")
-                },
-                "modifying_factors": {
-                    "aggravating_factors": collected_fields.get("aggravating_factors", "Not provided"),
-                    "relieving_factors": collected_fields.get("relieving_factors", "Not provided")
-                },
-                "additional_information": {
-                    "radiation": collected_fields.get("radiation", "Not provided"),
-                    "progression": collected_fields.get("progression", "Not provided"),
-                    "related_symptoms": collected_fields.get("related_symptoms", "Not provided"),
-                    "treatment_attempted": collected_fields.get("treatment_attempted", "Not provided")
-                }
-            }
+            organized_data = _organize_collected_data(
+                orjson.dumps(collected_fields, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            )
             
             # Calculate data completeness for context
             total_possible_fields = 14  # Based on OLDCARTS structure
-            filled_fields = len([v for v in collected_fields.values() if v and v not in ["Not provided", "unclear_response", "skipped_by_user"]])
+            filled_fields = sum(1 for v in collected_fields.values() if v and v not in _UNFILLED_VALUES)
             completion_percentage = (filled_fields / total_possible_fields) * 100
             
             base_context.update({
                 "is_auto_completion": bool(auto_completion_reason),
                 "auto_completion_reason": auto_completion_reason,
-                "total_messages": len(state.get("messages", [])),
+                "total_messages": tally.total,
                 "completion_type": "auto" if auto_completion_reason else "natural",
                 "organized_data": organized_data,
                 "raw_collected_fields": collected_fields,
@@ -233,9 +393,9 @@ class AgentFunctions:
                     "completion_readiness": state.get("completion_readiness", 0.0)
                 },
                 "conversation_stats": {
-                    "total_messages": len(state.get("messages", [])),
-                    "user_messages": len([m for m in state.get("messages", []) if isinstance(m, HumanMessage)]),
-                    "ai_messages": len([m for m in state.get("messages", []) if isinstance(m, AIMessage)])
+                    "total_messages": tally.total,
+                    "user_messages": tally.user_count,
+                    "ai_messages": tally.ai_count
                 }
             })
         
@@ -243,65 +403,42 @@ class AgentFunctions:
     
     def process_agent_response(self, state: ViState, agent: str, response: str) -> ViState:
         """Process the response from each AI agent."""
+        ai_context = state.setdefault("ai_context", {})
         
         if agent == AgentStep.ORCHESTRATOR.value:
             try:
                 # Parse orchestrator decision
-                if response.startswith("```json"):
-                    response = response.split("```json")[1].split("```")[0]
-                
-                decision = json.loads(response)
+                decision = orjson.loads(_strip_json_fence(response))
                 # Fix agent name mapping - normalize to lowercase values
                 next_agent = decision.get("next_agent", "greeting_agent")
                 
-                # Normalize agent names to match graph node names
-                if next_agent in ["GREETING_AGENT", "greeting_agent"]:
-                    next_agent = AgentStep.GREETING_AGENT.value
-                elif next_agent in ["EXTRACTION_AGENT", "extraction_agent"]:
-                    next_agent = AgentStep.EXTRACTION_AGENT.value
-                elif next_agent in ["EVALUATION_AGENT", "evaluation_agent"]:
-                    next_agent = AgentStep.EVALUATION_AGENT.value
-                elif next_agent in ["QUESTION_AGENT", "question_agent"]:
-                    next_agent = AgentStep.QUESTION_AGENT.value
-                elif next_agent in ["COMPLETION_AGENT", "completion_agent"]:
-                    next_agent = AgentStep.COMPLETION_AGENT.value
-                elif next_agent in ["EMERGENCY_AGENT", "emergency_agent"]:
-                    next_agent = AgentStep.EMERGENCY_AGENT.value
-                elif next_agent in ["END", "end"]:
-                    next_agent = "END"
-                else:
-                    # Default fallback
-                    next_agent = AgentStep.GREETING_AGENT.value
+                # Normalize agent names to match graph node names; unknown names fall back to greeting
+                next_agent = _AGENT_NAME_MAP.get(next_agent, AgentStep.GREETING_AGENT.value)
                 
                 state["next_step"] = next_agent
                 state["current_field"] = decision.get("priority_field", state.get("current_field", "age"))
                 
                 # Update AI context
-                if "ai_context" not in state:
-                    state["ai_context"] = {}
-                state["ai_context"]["orchestrator_reasoning"] = decision.get("reasoning", "")
-                state["ai_context"]["context_update"] = decision.get("context_update", {})
+                ai_context["orchestrator_reasoning"] = decision.get("reasoning", "")
+                ai_context["context_update"] = decision.get("context_update", {})
                 
-                print(f"🎯 Orchestrator Decision: {state['next_step']} → {state['current_field']}")
+                logger.debug("🎯 Orchestrator Decision: %s → %s", state["next_step"], state["current_field"])
                 
             except Exception as e:
-                print(f"❌ Error parsing orchestrator response: {e}")
+                logger.error("❌ Error parsing orchestrator response: %s", e)
                 state["next_step"] = AgentStep.GREETING_AGENT.value
         
         elif agent == AgentStep.GREETING_AGENT.value:
             # Add greeting message to conversation
-            state["messages"].append(AIMessage(content=response))
+            self._emit(state, response)
             # Greeting agent ends the turn - user will respond and trigger new orchestrator decision
-            state["ai_context"]["last_agent_action"] = "greeting_sent"
-            print(f"👋 Greeting generated: {response[:50]}...")
+            ai_context["last_agent_action"] = "greeting_sent"
+            logger.debug("👋 Greeting generated: %.50s...", response)
         
         elif agent == AgentStep.EXTRACTION_AGENT.value:
             try:
                 # Parse extraction results
-                if response.startswith("```json"):
-                    response = response.split("```json")[1].split("```")[0]
-                
-                extraction = json.loads(response)
+                extraction = orjson.loads(_strip_json_fence(response))
                 target_field = extraction.get("target_field")
                 extracted_value = extraction.get("extracted_value")
                 
@@ -309,114 +446,117 @@ class AgentFunctions:
                 if extracted_value not in ["unclear_response", "skipped_by_user"]:
                     state["collected_fields"][target_field] = extracted_value
                     state["retry_count"] = 0
-                    print(f"📊 Extraction SUCCESS: {target_field} = {extracted_value}")
+                    logger.debug("📊 Extraction SUCCESS: %s = %s", target_field, extracted_value)
                 else:
                     state["retry_count"] = state.get("retry_count", 0) + 1
-                    print(f"📊 Extraction UNCLEAR/SKIPPED: {target_field} = {extracted_value}")
+                    logger.debug("📊 Extraction UNCLEAR/SKIPPED: %s = %s", target_field, extracted_value)
                 
                 # Store additional data if found
                 additional_data = extraction.get("additional_data", {})
                 for field, value in additional_data.items():
                     if value and field not in state["collected_fields"]:
                         state["collected_fields"][field] = value
-                        print(f"📊 Additional data found: {field} = {value}")
+                        logger.debug("📊 Additional data found: %s = %s", field, value)
                         
                         # Special logging for severity
                         if field == "severity":
-                            print(f"🎯 SEVERITY DEBUG: Captured severity '{value}' from user input")
+                            logger.debug("🎯 SEVERITY DEBUG: Captured severity '%s' from user input", value)
                 
                 # Special debugging for severity extraction
                 user_message = self.get_last_user_message(state)
-                severity_keywords = ["severe", "mild", "moderate", "excruciating", "unbearable", "pain level", "scale", "out of 10", "/10"]
-                if any(keyword in user_message.lower() for keyword in severity_keywords):
+                if _SEVERITY_RE.search(user_message):
                     has_severity = "severity" in state["collected_fields"]
-                    print(f"🎯 SEVERITY DEBUG: User message contains severity keywords, captured: {has_severity}")
+                    logger.debug("🎯 SEVERITY DEBUG: User message contains severity keywords, captured: %s", has_severity)
                     if not has_severity:
-                        print(f"⚠️ SEVERITY WARNING: Keywords detected but severity not captured from: '{user_message}'")
+                        logger.debug("⚠️ SEVERITY WARNING: Keywords detected but severity not captured from: '%s'", user_message)
                 
                 # Update AI context
-                state["ai_context"]["last_extraction"] = extraction
-                state["ai_context"]["last_agent_action"] = "extraction_complete"
+                ai_context["last_extraction"] = extraction
+                ai_context["last_agent_action"] = "extraction_complete"
                 state["next_step"] = AgentStep.ORCHESTRATOR.value
                 
-                print(f"📊 Extraction: {target_field} = {extracted_value}")
+                logger.debug("📊 Extraction: %s = %s", target_field, extracted_value)
                 
             except Exception as e:
-                print(f"❌ Error parsing extraction response: {e}")
-                state["ai_context"]["last_agent_action"] = "extraction_error"
+                logger.error("❌ Error parsing extraction response: %s", e)
+                ai_context["last_agent_action"] = "extraction_error"
                 state["next_step"] = AgentStep.ORCHESTRATOR.value
         
         elif agent == AgentStep.EVALUATION_AGENT.value:
             try:
                 # Parse evaluation results
-                if response.startswith("```json"):
-                    response = response.split("```json")[1].split("```")[0]
-                
-                evaluation = json.loads(response)
+                evaluation = orjson.loads(_strip_json_fence(response))
                 state["completion_readiness"] = evaluation.get("completion_readiness", 0.0)
                 state["current_field"] = evaluation.get("next_field_to_collect", "age")
                 state["conversation_complete"] = evaluation.get("should_complete", False)
                 
                 # AUTO-COMPLETION CHECK: Override evaluation if thresholds met
-                total_messages = len(state.get("messages", []))
-                completion_readiness = state.get("completion_readiness", 0.0)
+                auto_completion = self.auto_completion_check(state)
+                total_messages = auto_completion["total_messages"]
+                completion_readiness = auto_completion["completion_readiness"]
                 
-                if total_messages >= 50 and completion_readiness >= 0.6:
-                    print(f"🚀 EVALUATION AUTO-COMPLETION: {total_messages} messages, {completion_readiness:.1f} completion - FORCING COMPLETION")
+                if auto_completion["should_auto_complete"]:
+                    logger.info(
+                        "🚀 EVALUATION AUTO-COMPLETION: %d messages, %.1f completion - FORCING COMPLETION",
+                        total_messages, completion_readiness
+                    )
                     state["conversation_complete"] = True
                     evaluation["should_complete"] = True
-                    state["ai_context"]["auto_completion_reason"] = f"Reached {total_messages} messages with {completion_readiness:.1f} completion"
+                    ai_context["auto_completion_reason"] = f"Reached {total_messages} messages with {completion_readiness:.1f} completion"
                 
                 # Handle emergency detection
                 if evaluation.get("emergency_detected", False):
                     emergency_level = evaluation.get("emergency_level", "MODERATE").upper()
                     state["emergency_level"] = emergency_level
                     state["next_step"] = AgentStep.EMERGENCY_AGENT.value
-                    state["ai_context"]["last_agent_action"] = "emergency_detected"
+                    ai_context["last_agent_action"] = "emergency_detected"
                 elif state["conversation_complete"]:
                     state["next_step"] = AgentStep.COMPLETION_AGENT.value
-                    state["ai_context"]["last_agent_action"] = "ready_for_completion"
+                    ai_context["last_agent_action"] = "ready_for_completion"
                 else:
                     # Evaluation complete, need to ask next question
                     state["next_step"] = AgentStep.QUESTION_AGENT.value
-                    state["ai_context"]["last_agent_action"] = "evaluation_complete_need_question"
+                    ai_context["last_agent_action"] = "evaluation_complete_need_question"
                 
                 # Update AI context
-                state["ai_context"]["evaluation"] = evaluation
+                ai_context["evaluation"] = evaluation
                 
-                print(f"📈 Evaluation: {state['completion_readiness']:.1f} readiness, next={state['current_field']} → {state['next_step']}")
+                logger.debug(
+                    "📈 Evaluation: %.1f readiness, next=%s → %s",
+                    state["completion_readiness"], state["current_field"], state["next_step"]
+                )
                 
             except Exception as e:
-                print(f"❌ Error parsing evaluation response: {e}")
-                state["ai_context"]["last_agent_action"] = "evaluation_error"
+                logger.error("❌ Error parsing evaluation response: %s", e)
+                ai_context["last_agent_action"] = "evaluation_error"
                 state["next_step"] = AgentStep.ORCHESTRATOR.value
         
         elif agent == AgentStep.QUESTION_AGENT.value:
             # Add question to conversation
-            state["messages"].append(AIMessage(content=response))
-            state["ai_context"]["last_agent_action"] = "question_asked"
+            self._emit(state, response)
+            ai_context["last_agent_action"] = "question_asked"
             state["next_step"] = AgentStep.ORCHESTRATOR.value
-            print(f"❓ Question generated: {response[:50]}...")
+            logger.debug("❓ Question generated: %.50s...", response)
         
         elif agent == AgentStep.COMPLETION_AGENT.value:
             # Add completion message and finalize
-            state["messages"].append(AIMessage(content=response))
+            self._emit(state, response)
             state["conversation_complete"] = True
             
             # Log completion type
-            auto_completion_reason = state.get("ai_context", {}).get("auto_completion_reason")
+            auto_completion_reason = ai_context.get("auto_completion_reason")
             if auto_completion_reason:
-                print(f"✅ AUTO-COMPLETION: {auto_completion_reason}")
+                logger.info("✅ AUTO-COMPLETION: %s", auto_completion_reason)
             else:
-                print(f"✅ NATURAL COMPLETION: User interaction complete")
+                logger.info("✅ NATURAL COMPLETION: User interaction complete")
             
-            print(f"✅ Completion: {response[:50]}...")
+            logger.debug("✅ Completion: %.50s...", response)
         
         elif agent == AgentStep.EMERGENCY_AGENT.value:
             # Add emergency message and finalize
-            state["messages"].append(AIMessage(content=response))
+            self._emit(state, response)
             state["conversation_complete"] = True
-            print(f"🚨 Emergency: {response[:50]}...")
+            logger.debug("🚨 Emergency: %.50s...", response)
         
         return state
     
@@ -427,40 +567,21 @@ class AgentFunctions:
         
         # Count messages
         messages = state.get("messages", [])
-        ai_message_count = len([msg for msg in messages if isinstance(msg, AIMessage)])
-        user_message_count = len([msg for msg in messages if isinstance(msg, HumanMessage)])
-        
-        print(f"🔍 Messages Debug: total={len(messages)}, ai={ai_message_count}, user={user_message_count}")
-        for i, msg in enumerate(messages):
-            msg_type = "AI" if isinstance(msg, AIMessage) else "USER"
-            content_preview = msg.content[:50] + "..." if len(msg.content) > 50 else msg.content
-            print(f"  [{i}] {msg_type}: {content_preview}")
-        
-        print(f"🔍 Orchestrator Debug: ai_msgs={ai_message_count}, user_msgs={user_message_count}, last_action={last_agent_action}, state={next_step}")
+        tally = self.tally_messages(state)
+        ai_message_count = tally.ai_count
+        user_message_count = tally.user_count
         
-        # Allow initial greeting even with no messages
-        if ai_message_count == 0 and user_message_count == 0 and next_step == AgentStep.GREETING_AGENT.value:
-            print(f"🎯 INITIAL GREETING: Allowing greeting agent to run")
-            return next_step
+        _log_messages(messages, tally)
         
-        # FIXED LOGIC: Allow processing when user has responded and we need to extract/process
-        # Only force END if we've already processed the user's latest message
-        if ai_message_count > user_message_count:
-            print(f"🛑 FORCED END: ai_msgs={ai_message_count} > user_msgs={user_message_count} (already processed)")
-            return "END"
-        
-        # Allow extraction and evaluation agents to run even when message counts are equal
-        # because they need to process the user's response
-        if next_step in [AgentStep.EXTRACTION_AGENT.value, AgentStep.EVALUATION_AGENT.value]:
-            print(f"🎯 ALLOWING PROCESSING: {next_step} can run to process user response")
-            return next_step
-        
-        # If we just asked a question, we should wait for response
-        if last_agent_action == "question_asked" and ai_message_count >= user_message_count:
-            print(f"🛑 FORCED END: last_agent_action={last_agent_action}")
-            return "END"
+        logger.debug(
+            "🔍 Orchestrator Debug: ai_msgs=%d, user_msgs=%d, last_action=%s, state=%s",
+            ai_message_count, user_message_count, last_agent_action, next_step
+        )
         
-        return next_step
+        key = (_message_relation(ai_message_count, user_message_count), next_step, last_agent_action == "question_asked")
+        route = _ROUTE_TABLE.get(key) or _route_decision(*key)
+        logger.debug("🧭 Route: %s → %s", key, route)
+        return route
     
     def route_from_evaluation(self, state: ViState) -> str:
         """Route from evaluation agent based on its decision."""
@@ -472,12 +593,36 @@ class AgentFunctions:
         
         return next_step
     
+    def tally_messages(self, state: ViState) -> MessageTally:
+        """Return the message tally for this state, recounting only after messages change."""
+        messages = state.get("messages", [])
+        tally = state.get("message_tally")
+        if tally is None or tally.total != len(messages):
+            tally = _tally_messages(messages)
+            state["message_tally"] = tally
+        return tally
+    
+    def _emit(self, state: ViState, content: str) -> None:
+        """Append an assistant message and advance the cached message tally in place."""
+        tally = self.tally_messages(state)
+        state["messages"].append(AIMessage(content=content))
+        state["message_tally"] = tally._replace(total=tally.total + 1, ai_count=tally.ai_count + 1, last_ai=content)
+    
+    def auto_completion_check(self, state: ViState) -> Dict[str, Any]:
+        """Check the auto-completion thresholds (message count and completion readiness)."""
+        total_messages = self.tally_messages(state).total
+        completion_readiness = state.get("completion_readiness", 0.0)
+        return {
+            "total_messages": total_messages,
+            "completion_readiness": completion_readiness,
+            "should_auto_complete": (
+                total_messages >= AUTO_COMPLETE_MIN_MESSAGES and completion_readiness >= AUTO_COMPLETE_MIN_READINESS
+            )
+        }
+    
     def get_last_user_message(self, state: ViState) -> str:
-        """Get the last user message from the conversation."""
-        for msg in reversed(state.get("messages", [])):
-            if isinstance(msg, HumanMessage):
-                return msg.content
-        return ""
+        """Get the last user message from the conversation (via the cached message tally)."""
+        return self.tally_messages(state).last_user
     
     def get_recent_messages(self, state: ViState, count: int) -> List[Dict[str, str]]:
         """Get recent messages for context."""
@@ -489,14 +634,22 @@ class AgentFunctions:
     
     def handle_agent_error(self, state: ViState, agent: str, error: str) -> ViState:
         """Handle errors in AI agents gracefully."""
-        print(f"🔧 Handling error in {agent}: {error}")
+        logger.warning("🔧 Handling error in %s: %s", agent, error)
+        
+        # Replace the last action so a failed step is never mistaken for a finished one
+        # (a stale extraction_complete would send the orchestrator straight back to evaluation)
+        state.setdefault("ai_context", {})["last_agent_action"] = f"{agent}_error"
         
         # Default fallback actions
         if agent == AgentStep.ORCHESTRATOR.value:
             state["next_step"] = AgentStep.GREETING_AGENT.value
         elif agent == AgentStep.GREETING_AGENT.value:
-            state["messages"].append(AIMessage(content="Hello! I'm Vi, your virtual health assistant. How can I help you today?"))
+            self._emit(state, "Hello! I'm Vi, your virtual health assistant. How can I help you today?")
             state["next_step"] = AgentStep.ORCHESTRATOR.value
+        elif agent == AgentStep.EVALUATION_AGENT.value:
+            # End the turn instead of re-running extraction and evaluation against a failing model
+            self._emit(state, "I'm sorry, I had trouble processing that. Could you please tell me again?")
+            state["next_step"] = "END"
         else:
             state["next_step"] = AgentStep.ORCHESTRATOR.value
         
@@ -5,6 +5,9 @@ Contains all AI agent system prompts for the multi-agent medical conversation sy
 Each agent has specialized instructions for their specific medical consultation tasks.
 """
 
+import sys
+from types import MappingProxyType
+
 from .states import AgentStep
 
 
@@ -368,3 +371,6 @@ EMERGENCY RESPONSE STRUCTURE:
 Generate an appropriate emergency response based on the severity level.
 """
 }
+
+# Read-only at runtime; interned keys match AgentStep values by identity on lookup
+AGENT_SYSTEM_PROMPTS = MappingProxyType({sys.intern(step): prompt for step, prompt in AGENT_SYSTEM_PROMPTS.items()})
@@ -7,9 +7,13 @@ Handles conversation processing, state management, and result generation.
 
 import os
 import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import anyio
+from anyio.from_thread import threadlocals
 from langchain_core.messages import SystemMessage, AIMessage, HumanMessage
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, END
@@ -20,9 +24,13 @@ from sqlalchemy.orm import Session
 try:
     from agent.config.models import Conversation, SessionStatus, EmergencyLevel
     from agent.config.database import get_db
+    from agent.config.queries import CONVERSATION_BY_SESSION_ID
+    from agent.config.openai_client import get_openai_async_client, get_openai_http_client
 except ImportError:
     from ..config.models import Conversation, SessionStatus, EmergencyLevel
     from ..config.database import get_db
+    from ..config.queries import CONVERSATION_BY_SESSION_ID
+    from ..config.openai_client import get_openai_async_client, get_openai_http_client
 
 # Import modular components
 from .states import ViState, AgentStep
@@ -33,12 +41,32 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _in_anyio_worker_thread() -> bool:
+    """Whether this is an AnyIO worker thread (FastAPI's threadpool) that can call back into its loop."""
+    return getattr(threadlocals, "current_token", None) is not None
+
+
+def _event_loop_running() -> bool:
+    """Whether an asyncio event loop is already running in this thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class DynamicViAgent:
     """Fully dynamic multi-agent AI system for medical conversations."""
     
     def __init__(self, db: Session, api_key: str):
         self.db = db
-        self.llm = ChatOpenAI(model="gpt-4o-mini", api_key=api_key, temperature=0.7)
+        self.llm = ChatOpenAI(
+            model="gpt-4o-mini",
+            api_key=api_key,
+            temperature=0.7,
+            http_client=get_openai_http_client(),
+            http_async_client=get_openai_async_client()
+        )
         self.agent_functions = AgentFunctions(self.llm, self.db)
         self.graph = self._build_dynamic_graph()
     
@@ -94,6 +122,21 @@ class DynamicViAgent:
         
         return graph.compile()
     
+    def _run_graph(self, state: ViState) -> ViState:
+        """Run the async agent graph from synchronous code.
+        
+        Inside FastAPI's threadpool the graph runs on the server's event loop, so its
+        LLM calls share the warm async OpenAI pool; anywhere else it gets its own loop.
+        """
+        if _in_anyio_worker_thread():
+            return anyio.from_thread.run(self.graph.ainvoke, state)
+        if not _event_loop_running():
+            # Scripts and tests
+            return asyncio.run(self.graph.ainvoke(state))
+        # Called from a coroutine: this thread's loop can't be blocked on, so use a helper thread's
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.graph.ainvoke(state)).result()
+    
     def _finalize_conversation(self, state: ViState):
         """Finalize the conversation in the database."""
         try:
@@ -101,7 +144,7 @@ class DynamicViAgent:
             if not session_id:
                 return
             
-            conversation = self.db.query(Conversation).filter_by(session_id=session_id).first()
+            conversation = self.db.execute(CONVERSATION_BY_SESSION_ID, {"session_id": session_id}).scalars().first()
             if conversation:
                 conversation.status = SessionStatus.COMPLETED.value
                 conversation.collected_data = state.get("collected_fields", {})
@@ -133,7 +176,7 @@ class DynamicViAgent:
                 # This ensures we get the latest data and any pending transactions are committed
                 self.db.commit()  # Commit any pending transactions first
                 
-                conversation = self.db.query(Conversation).filter_by(session_id=session_id).first()
+                conversation = self.db.execute(CONVERSATION_BY_SESSION_ID, {"session_id": session_id}).scalars().first()
                 if conversation:
                     # Force refresh to get the latest data from database
                     self.db.refresh(conversation)
@@ -219,7 +262,7 @@ class DynamicViAgent:
             )
             
             # Run through the dynamic AI system
-            final_state = self.graph.invoke(initial_state)
+            final_state = self._run_graph(initial_state)
             
             # DEBUG: Check final state
             print(f"🔍 Final state debug:")
@@ -234,7 +277,7 @@ class DynamicViAgent:
                 
                 # IMPROVED SAVE LOGIC: Use merge and explicit flags to ensure persistence
                 # Fetch a fresh conversation object to avoid session issues
-                conversation = self.db.query(Conversation).filter_by(session_id=session_id).first()
+                conversation = self.db.execute(CONVERSATION_BY_SESSION_ID, {"session_id": session_id}).scalars().first()
                 if conversation:
                     # Save messages to database
                     messages_to_save = []
@@ -283,7 +326,7 @@ class DynamicViAgent:
                     self.db.commit()  # Commit transaction
                     
                     # VERIFICATION: Immediately verify the save worked
-                    verification_conversation = self.db.query(Conversation).filter_by(session_id=session_id).first()
+                    verification_conversation = self.db.execute(CONVERSATION_BY_SESSION_ID, {"session_id": session_id}).scalars().first()
                     if verification_conversation:
                         self.db.refresh(verification_conversation)
                         saved_fields = verification_conversation.collected_data or {}
@@ -4,11 +4,20 @@
 Contains state definitions, enums, and data structures for the multi-agent medical system.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple, Optional
 from enum import Enum
 from typing_extensions import TypedDict
 
 
+class MessageTally(NamedTuple):
+    """Message counts for a conversation, valid while the list still has ``total`` entries."""
+    total: int
+    ai_count: int
+    user_count: int
+    last_user: str
+    last_ai: str
+
+
 class ViState(TypedDict):
     """Dynamic state for multi-agent AI system."""
     messages: List
@@ -24,6 +33,7 @@ class ViState(TypedDict):
     emergency_flags: List[str]
     retry_count: int
     completion_readiness: float
+    message_tally: Optional[MessageTally]
 
 
 class AgentStep(Enum):
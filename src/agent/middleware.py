@@ -0,0 +1,178 @@
+"""
+⚡ Pure-ASGI middleware for the AI Medical Assistant.
+
+These classes wrap the raw ASGI callable directly rather than going through
+Starlette's Request/Response objects, and encode their fixed headers once
+when the app starts instead of on every response.
+"""
+
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Headers = List[Tuple[bytes, bytes]]
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+SAFELISTED_HEADERS = frozenset({"accept", "accept-language", "content-language", "content-type"})
+
+_TEXT_PLAIN = (b"content-type", b"text/plain; charset=utf-8")
+VARY_ORIGIN = (b"vary", b"Origin")
+PREFLIGHT_VARY = b"Access-Control-Request-Headers, Access-Control-Request-Method, Origin"
+
+
+async def _respond(send: Send, status: int, body: bytes, headers: Headers) -> None:
+    """Send a complete response without involving the application."""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [*headers, (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class FastCORS:
+    """CORS middleware with every allow-* header pre-encoded at startup.
+
+    Mirrors Starlette's ``CORSMiddleware`` options and behaviour: preflights
+    are answered here without reaching the app, and every other response
+    gets the CORS headers appended to ``http.response.start``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str] = (),
+        allow_methods: Iterable[str] = ("GET",),
+        allow_headers: Iterable[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        allow_origins = tuple(allow_origins)
+        allow_methods = ALL_METHODS if "*" in allow_methods else tuple(allow_methods)
+        allow_headers = tuple(allow_headers)
+
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_all_headers = "*" in allow_headers
+        self.origins: FrozenSet[bytes] = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self.methods: FrozenSet[bytes] = frozenset(method.encode() for method in allow_methods)
+        self.headers: FrozenSet[bytes] = frozenset(
+            header.lower().encode() for header in SAFELISTED_HEADERS.union(allow_headers) if header != "*"
+        )
+
+        # A literal "*" origin is only valid without credentials; otherwise the origin is echoed back
+        self.wildcard_origin = self.allow_all_origins and not allow_credentials
+        self.simple_headers: Headers = [(b"access-control-allow-credentials", b"true")] if allow_credentials else []
+        self.preflight_headers: Headers = [
+            *self.simple_headers,
+            (b"vary", PREFLIGHT_VARY),
+            (b"access-control-allow-methods", b", ".join(sorted(self.methods))),
+            (b"access-control-max-age", str(max_age).encode()),
+            _TEXT_PLAIN,
+        ]
+        if not self.allow_all_headers:
+            self.preflight_headers.append((b"access-control-allow-headers", b", ".join(sorted(self.headers))))
+
+    def is_allowed_origin(self, origin: bytes) -> bool:
+        """Check an Origin header value against the configured origins."""
+        return self.allow_all_origins or origin in self.origins
+
+    def allow_origin_header(self, origin: bytes) -> Tuple[bytes, bytes]:
+        """Build the access-control-allow-origin header for a request origin."""
+        return (b"access-control-allow-origin", b"*" if self.wildcard_origin else origin)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is not None and scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight(send, origin, request_method, request_headers)
+            return
+
+        # Vary: Origin goes on every response so caches never reuse one origin's headers for another
+        if origin is None:
+            cors_headers = [VARY_ORIGIN]
+        elif self.is_allowed_origin(origin):
+            cors_headers = [self.allow_origin_header(origin), VARY_ORIGIN, *self.simple_headers]
+        else:
+            cors_headers = [VARY_ORIGIN, *self.simple_headers]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Copy rather than mutate: inner middleware may reuse a cached start message
+                message = {**message, "headers": [*message.get("headers", ()), *cors_headers]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def preflight(
+        self, send: Send, origin: bytes, request_method: bytes, request_headers: Optional[bytes]
+    ) -> None:
+        """Answer an OPTIONS preflight from the cached headers."""
+        origin_allowed = self.is_allowed_origin(origin)
+        headers = [self.allow_origin_header(origin), *self.preflight_headers] if origin_allowed else list(self.preflight_headers)
+
+        allowed = origin_allowed and request_method in self.methods
+        if allowed and request_headers and not self.allow_all_headers:
+            requested = {header.strip() for header in request_headers.lower().split(b",")}
+            allowed = requested <= self.headers
+        if not allowed:
+            await _respond(send, 400, b"Disallowed CORS origin, method or headers", headers)
+            return
+
+        if self.allow_all_headers and request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+        await _respond(send, 200, b"OK", headers)
+
+
+class HealthShortCircuit:
+    """Answer ``GET`` liveness probes from a pre-encoded body ahead of the router."""
+
+    def __init__(self, app: ASGIApp, body: bytes, path: str = "/health") -> None:
+        self.app = app
+        self.path = path
+        self.body = body
+        self.start_message: Message = {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        }
+        self.body_message: Message = {"type": "http.response.body", "body": body}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == self.path and scope["method"] == "GET":
+            await send(self.start_message)
+            await send(self.body_message)
+            return
+        await self.app(scope, receive, send)
+
+
+class StreamingAwareGZip:
+    """Starlette's ``GZipMiddleware``, bypassed for Server-Sent Event requests.
+
+    Compressing an event stream buffers it, so clients that ask for
+    ``text/event-stream`` go straight to the app.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000, compresslevel: int = 5) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not any(
+            name == b"accept" and b"text/event-stream" in value for name, value in scope["headers"]
+        ):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
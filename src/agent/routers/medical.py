@@ -5,35 +5,54 @@ Updated router using the new LangGraph architecture with individual agent nodes
 for real-time testing of the multi-agent system.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, undefer_group
 from typing import Dict, Any, Optional, List
-import os
 
-from ..config.database import get_db
+from ..config.database import get_async_db, get_db
+from ..responses import ORJSONResponse
+from ..config.settings import Settings, get_settings
 from ..medical_assistant_agent.result import DynamicViAgent
-from ..config.models import Conversation, SessionStatus, Message
+from ..services.session import SessionService
+from ..config.models import Conversation, Message, SessionStatus, User
+from ..config.queries import (
+    CONVERSATION_BY_SESSION_ID,
+    CONVERSATION_ID_BY_SESSION_ID,
+    MESSAGE_COUNT_BY_CONVERSATION,
+    MESSAGES_BY_CONVERSATION,
+)
 from ..config.schemas import (
     ChatRequest, 
     ChatResponse, 
     SessionStatusResponse, 
-    AICapabilitiesResponse,
-    ConversationMessage,
+    HISTORY_MESSAGE_TYPES,
     AIContext,
     OldcartsProgress,
     Summary,
-    EmergencyLevel
+    EMERGENCY_LEVELS,
+    build,
+    encode_chat_response,
+    oldcarts_mask
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/medical",
     tags=["Medical AI Assistant"],
     responses={404: {"description": "Not found"}},
 )
 
-def get_dynamic_vi_agent(db: Session = Depends(get_db)) -> DynamicViAgent:
+def get_dynamic_vi_agent(
+    db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings)
+) -> DynamicViAgent:
     """Get Dynamic Vi Agent instance."""
-    openai_api_key = os.getenv("OPENAI_API_KEY")
+    openai_api_key = settings.OPENAI_API_KEY
     if not openai_api_key:
         raise HTTPException(status_code=500, detail="OpenAI API key not configured")
     
@@ -41,7 +60,8 @@ def get_dynamic_vi_agent(db: Session = Depends(get_db)) -> DynamicViAgent:
 
 @router.post(
     "/chat",
-    response_model=ChatResponse,
+    response_model=None,
+    responses={200: {"model": ChatResponse}},
     summary="Chat with Vi Medical Assistant",
     description="""
     **Chat with Vi, the AI Medical Assistant using LangGraph multi-agent architecture.**
@@ -68,13 +88,17 @@ def get_dynamic_vi_agent(db: Session = Depends(get_db)) -> DynamicViAgent:
     - Agent routing and reasoning details
     """
 )
-async def chat_with_dynamic_vi(
+def chat_with_dynamic_vi(
     request: ChatRequest,
     db: Session = Depends(get_db),
     vi_agent: DynamicViAgent = Depends(get_dynamic_vi_agent)
-) -> ChatResponse:
+) -> Response:
     """
     Chat with Dynamic Vi Agent using LangGraph multi-agent architecture.
+    
+    DynamicViAgent and SessionService are synchronous (blocking Session and LLM
+    calls), so this is a plain ``def`` route that FastAPI runs in its threadpool
+    instead of stalling the event loop.
     """
     try:
         # Process message with Dynamic Vi Agent
@@ -87,40 +111,29 @@ async def chat_with_dynamic_vi(
         # Get conversation history
         conversation_history = []
         if response.get("session_id"):
-            conversation = db.query(Conversation).filter(
-                Conversation.session_id == response["session_id"]
-            ).first()
+            conversation = db.execute(
+                CONVERSATION_BY_SESSION_ID, {"session_id": response["session_id"]}
+            ).scalars().first()
             
             if conversation:
                 # Add message to database if we have a user message
                 if request.message:
-                    # Add user message
-                    user_msg = Message(
-                        conversation_id=conversation.id,
-                        role="user",
-                        content=request.message,
-                        phase=response.get("current_section", "unknown")
-                    )
-                    db.add(user_msg)
+                    phase = response.get("current_section", "unknown")
+                    session_service = SessionService(db)
                     
-                    # Add Vi's response
-                    vi_msg = Message(
-                        conversation_id=conversation.id,
-                        role="assistant",
-                        content=response.get("message", ""),
-                        phase=response.get("current_section", "unknown")
-                    )
-                    db.add(vi_msg)
+                    # Write the user message and Vi's response in one INSERT
+                    session_service.queue_message(conversation, "user", request.message, phase=phase)
+                    session_service.queue_message(conversation, "assistant", response.get("message", ""), phase=phase)
+                    session_service.flush_messages()
                     db.commit()
                 
                 # Get all messages for conversation history
-                messages = db.query(Message).filter(
-                    Message.conversation_id == conversation.id
-                ).order_by(Message.timestamp).all()
+                messages = db.execute(
+                    MESSAGES_BY_CONVERSATION, {"conversation_id": conversation.id}
+                ).scalars().all()
                 
                 conversation_history = [
-                    ConversationMessage(
-                        role=msg.role,
+                    HISTORY_MESSAGE_TYPES[msg.role](
                         content=msg.content,
                         timestamp=msg.timestamp.isoformat(),
                         phase=msg.phase
@@ -131,8 +144,11 @@ async def chat_with_dynamic_vi(
         # Build enhanced response using Pydantic models
         collected_data = response.get("collected_data", {})
         fields_completed = len([v for v in collected_data.values() if v and v not in ["unclear_response", "skipped_by_user"]])
-        
-        enhanced_response = ChatResponse(
+        emergency_level = response.get("emergency_level", "NONE")
+        if emergency_level not in EMERGENCY_LEVELS:
+            emergency_level = "NONE"
+        enhanced_response = build(
+            ChatResponse,
             # Core response data
             session_id=response.get("session_id", ""),
             message=response.get("message", ""),
@@ -146,14 +162,15 @@ async def chat_with_dynamic_vi(
             
             # Progress and status
             completion_readiness=response.get("completion_readiness", 0.0),
-            emergency_level=EmergencyLevel(response.get("emergency_level", "NONE")),
+            emergency_level=emergency_level,
             
             # Conversation history
             conversation_history=conversation_history,
             total_messages=len(conversation_history),
             
             # Agent context
-            ai_context=AIContext(
+            ai_context=build(
+                AIContext,
                 last_agent_action=response.get("ai_context", {}).get("last_agent_action"),
                 last_extraction=response.get("ai_context", {}).get("last_extraction"),
                 orchestrator_reasoning=response.get("ai_context", {}).get("orchestrator_reasoning"),
@@ -162,60 +179,58 @@ async def chat_with_dynamic_vi(
             ),
             
             # OLDCARTS progress breakdown
-            oldcarts_progress=OldcartsProgress(
-                age="✅" if collected_data.get("age") else "❌",
-                biological_sex="✅" if collected_data.get("biological_sex") else "❌",
-                primary_complaint="✅" if collected_data.get("primary_complaint") else "❌",
-                onset="✅" if collected_data.get("onset") else "❌",
-                location="✅" if collected_data.get("location") else "❌",
-                duration="✅" if collected_data.get("duration") else "❌",
-                character="✅" if collected_data.get("character") else "❌",
-                severity="✅" if collected_data.get("severity") else "❌"
-            ),
+            oldcarts_progress=build(OldcartsProgress, progress_mask=oldcarts_mask(collected_data)),
             
             # Summary statistics
-            summary=Summary(
+            summary=build(
+                Summary,
                 total_fields_possible=15,
                 fields_completed=fields_completed,
                 completion_percentage=round((fields_completed / 15) * 100, 1)
             )
         )
         
-        return enhanced_response
+        # Serialize once via the cached adapter, bypassing jsonable_encoder
+        return Response(
+            content=encode_chat_response(enhanced_response),
+            media_type="application/json"
+        )
         
     except Exception as e:
-        print(f"Error in Dynamic Vi chat: {e}")
+        logger.exception("❌ Error in Dynamic Vi chat")
         raise HTTPException(status_code=500, detail=f"Error processing message: {str(e)}")
 
 @router.get(
     "/session/{session_id}/status",
-    response_model=SessionStatusResponse,
+    response_model=None,
+    responses={200: {"model": SessionStatusResponse}},
     summary="Get Session Status",
     description="Get current session status, progress, and collected data for a specific session."
 )
 async def get_session_status(
     session_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> SessionStatusResponse:
     """Get current session status and progress."""
     try:
-        conversation = db.query(Conversation).filter(
-            Conversation.session_id == session_id
-        ).first()
+        conversation = (await db.execute(
+            CONVERSATION_BY_SESSION_ID, {"session_id": session_id}
+        )).scalars().first()
         
         if not conversation:
             raise HTTPException(status_code=404, detail="Session not found")
         
         # Get message count
-        message_count = db.query(Message).filter(
-            Message.conversation_id == conversation.id
-        ).count()
+        message_count = (await db.execute(
+            MESSAGE_COUNT_BY_CONVERSATION, {"conversation_id": conversation.id}
+        )).scalar_one()
         
         # Get collected fields
         collected_data = conversation.collected_data or {}
         fields_collected = len(collected_data)
         
-        return SessionStatusResponse(
+        return build(
+            SessionStatusResponse,
             session_id=session_id,
             status=conversation.status,
             current_phase=conversation.current_phase,
@@ -231,19 +246,19 @@ async def get_session_status(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error getting session status: {e}")
+        logger.exception("❌ Error getting session status")
         raise HTTPException(status_code=500, detail=f"Error retrieving session status: {str(e)}")
 
 @router.get("/session/{session_id}/summary")
 async def get_session_summary(
     session_id: str,
-    db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """Get a summary of the collected medical data."""
     try:
-        conversation = db.query(Conversation).filter(
-            Conversation.session_id == session_id
-        ).first()
+        conversation = (await db.execute(
+            CONVERSATION_BY_SESSION_ID, {"session_id": session_id}
+        )).scalars().first()
         
         if not conversation:
             raise HTTPException(status_code=404, detail="Session not found")
@@ -288,12 +303,12 @@ async def get_session_summary(
             "conversation_status": conversation.status
         }
         
-        return summary
+        return ORJSONResponse(summary)
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error getting session summary: {e}")
+        logger.exception("❌ Error getting session summary")
         raise HTTPException(status_code=500, detail=f"Error retrieving session summary: {str(e)}")
 
 @router.get(
@@ -303,37 +318,39 @@ async def get_session_summary(
 )
 async def get_user_sessions(
     user_id: str,
-    db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """Get all sessions for a specific user."""
     try:
-        # Query all conversations for the user
-        conversations = db.query(Conversation).filter(
-            Conversation.user_id == user_id
-        ).order_by(Conversation.started_at.desc()).all()
+        # Query all conversations for the user; the path carries the public user id, not the integer FK
+        conversations = (await db.execute(
+            select(Conversation)
+            .join(Conversation.user)
+            .where(User.user_id == user_id)
+            .order_by(Conversation.started_at.desc())
+            .options(undefer_group("large_json"), selectinload(Conversation.messages).undefer(Message.content))
+        )).scalars().all()
         
         if not conversations:
-            return {
+            return ORJSONResponse({
                 "user_id": user_id,
                 "total_sessions": 0,
                 "sessions": [],
                 "message": "No sessions found for this user"
-            }
+            })
         
         # Build session list with details
         sessions = []
         for conversation in conversations:
-            # Get all messages for this session from Message table
-            messages = db.query(Message).filter(
-                Message.conversation_id == conversation.id
-            ).order_by(Message.timestamp.asc()).all()
+            # Messages are batch-loaded (selectin) and ordered by timestamp
+            messages = conversation.messages
             
             # Build conversation history from Message table
             conversation_history = [
                 {
                     "role": msg.role,
                     "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
+                    "timestamp": msg.timestamp,
                     "phase": msg.phase
                 }
                 for msg in messages
@@ -355,8 +372,8 @@ async def get_user_sessions(
                             }
                             for msg in saved_messages if isinstance(msg, dict)
                         ]
-                except Exception as e:
-                    print(f"Error parsing ai_context for session {conversation.session_id}: {e}")
+                except Exception:
+                    logger.exception("❌ Error parsing ai_context for session %s", conversation.session_id)
                     conversation_history = []
             
             # Get collected fields count
@@ -365,15 +382,15 @@ async def get_user_sessions(
             
             session_info = {
                 "session_id": conversation.session_id,
-                "status": conversation.status.value if conversation.status else "UNKNOWN",
+                "status": conversation.status or "UNKNOWN",
                 "current_phase": conversation.current_phase,
-                "emergency_level": conversation.emergency_level.value if conversation.emergency_level else "NONE",
+                "emergency_level": conversation.emergency_level or "NONE",
                 "message_count": len(conversation_history),
                 "fields_collected": fields_collected,
                 "completion_percentage": round((fields_collected / 15) * 100, 1),
-                "created_at": conversation.started_at.isoformat() if conversation.started_at else None,
-                "updated_at": conversation.updated_at.isoformat() if conversation.updated_at else None,
-                "completed_at": conversation.completed_at.isoformat() if conversation.completed_at else None,
+                "created_at": conversation.started_at,
+                "updated_at": conversation.updated_at,
+                "completed_at": conversation.completed_at,
                 "collected_data": collected_data,  # Full collected data instead of just preview
                 "conversation_history": conversation_history,  # Complete conversation
                 "collected_data_preview": {
@@ -384,7 +401,7 @@ async def get_user_sessions(
             }
             sessions.append(session_info)
         
-        return {
+        return ORJSONResponse({
             "user_id": user_id,
             "total_sessions": len(sessions),
             "sessions": sessions,
@@ -393,10 +410,10 @@ async def get_user_sessions(
                 "completed_sessions": len([s for s in sessions if s["status"] == "COMPLETED"]),
                 "emergency_sessions": len([s for s in sessions if s["status"] == "EMERGENCY"])
             }
-        }
+        })
         
     except Exception as e:
-        print(f"Error getting user sessions: {e}")
+        logger.exception("❌ Error getting user sessions")
         raise HTTPException(status_code=500, detail=f"Error retrieving user sessions: {str(e)}")
 
 @router.get(
@@ -406,46 +423,49 @@ async def get_user_sessions(
 )
 async def get_session_conversations(
     session_id: str,
-    db: Session = Depends(get_db)
-) -> Dict[str, Any]:
+    db: AsyncSession = Depends(get_async_db)
+) -> ORJSONResponse:
     """Get all completed conversations for a specific session."""
     try:
         # Query only completed conversations for the session
-        conversations = db.query(Conversation).filter(
-            Conversation.session_id == session_id,
-            Conversation.status == SessionStatus.COMPLETED.value
-        ).order_by(Conversation.started_at.desc()).all()
+        conversations = (await db.execute(
+            select(Conversation)
+            .where(
+                Conversation.session_id == session_id,
+                Conversation.status == SessionStatus.COMPLETED.value
+            )
+            .order_by(Conversation.started_at.desc())
+            .options(undefer_group("large_json"), selectinload(Conversation.messages).undefer(Message.content))
+        )).scalars().all()
         
         if not conversations:
             # Check if session exists but has no completed conversations
-            session_exists = db.query(Conversation).filter(
-                Conversation.session_id == session_id
-            ).first()
+            session_exists = (await db.execute(
+                CONVERSATION_ID_BY_SESSION_ID, {"session_id": session_id}
+            )).scalar_one_or_none()
             
             if not session_exists:
                 raise HTTPException(status_code=404, detail="Session not found")
             else:
-                return {
+                return ORJSONResponse({
                     "session_id": session_id,
                     "total_completed_conversations": 0,
                     "conversations": [],
                     "message": "No completed conversations found for this session"
-                }
+                })
         
         # Build conversation details with messages
         conversation_details = []
         for conversation in conversations:
-            # Get all messages for this conversation
-            messages = db.query(Message).filter(
-                Message.conversation_id == conversation.id
-            ).order_by(Message.timestamp.asc()).all()
+            # Messages are batch-loaded (selectin) and ordered by timestamp
+            messages = conversation.messages
             
             # Build message history
             message_history = [
                 {
                     "role": msg.role,
                     "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat(),
+                    "timestamp": msg.timestamp,
                     "phase": msg.phase
                 }
                 for msg in messages
@@ -459,15 +479,15 @@ async def get_session_conversations(
                 "conversation_id": conversation.id,
                 "session_id": conversation.session_id,
                 "user_id": conversation.user_id,
-                "status": conversation.status.value if conversation.status else "UNKNOWN",
+                "status": conversation.status or "UNKNOWN",
                 "current_phase": conversation.current_phase,
-                "emergency_level": conversation.emergency_level.value if conversation.emergency_level else "NONE",
+                "emergency_level": conversation.emergency_level or "NONE",
                 "message_count": len(message_history),
                 "fields_collected": fields_collected,
                 "completion_percentage": round((fields_collected / 15) * 100, 1),
-                "created_at": conversation.started_at.isoformat() if conversation.started_at else None,
-                "completed_at": conversation.completed_at.isoformat() if conversation.completed_at else None,
-                "updated_at": conversation.updated_at.isoformat() if conversation.updated_at else None,
+                "created_at": conversation.started_at,
+                "completed_at": conversation.completed_at,
+                "updated_at": conversation.updated_at,
                 "collected_data": collected_data,
                 "message_history": message_history,
                 "summary": {
@@ -480,7 +500,7 @@ async def get_session_conversations(
             }
             conversation_details.append(conversation_info)
         
-        return {
+        return ORJSONResponse({
             "session_id": session_id,
             "total_completed_conversations": len(conversation_details),
             "conversations": conversation_details,
@@ -490,12 +510,12 @@ async def get_session_conversations(
                 "average_fields_collected": round(sum(c["fields_collected"] for c in conversation_details) / len(conversation_details), 1) if conversation_details else 0,
                 "emergency_conversations": len([c for c in conversation_details if c["emergency_level"] != "NONE"])
             }
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error getting session conversations: {e}")
+        logger.exception("❌ Error getting session conversations")
         raise HTTPException(status_code=500, detail=f"Error retrieving session conversations: {str(e)}")
 
 
@@ -8,11 +8,13 @@ from sqlalchemy.orm import Session
 # Handle both direct execution and package imports
 try:
     from ..config.models import User
+    from ..config.queries import USER_BY_USER_ID
     from ..config.schemas import UserCreate
 except ImportError:
     # Direct execution - add parent directory to path
     sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
     from agent.config.models import User
+    from agent.config.queries import USER_BY_USER_ID
     from agent.config.schemas import UserCreate
 
 
@@ -24,7 +26,7 @@ class AuthService:
 
     def get_user_by_user_id(self, user_id: str) -> Optional[User]:
         """Get user by user_id."""
-        return self.db.query(User).filter(User.user_id == user_id).first()
+        return self.db.execute(USER_BY_USER_ID, {"user_id": user_id}).scalars().first()
 
     def create_user(self, user_create: UserCreate) -> User:
         """Create a new user."""
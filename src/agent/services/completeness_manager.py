@@ -15,7 +15,7 @@ import sys
 import os
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from enum import Enum
 
 # Handle both direct execution and package imports
@@ -252,7 +252,9 @@ class CompletenessManager:
     
     def handle_skip_request(self, conversation_id: int, question_id: str, skip_reason: str = "user_preference") -> Dict[str, Any]:
         """Handle when a user wants to skip a question."""
-        conversation = self.db.query(Conversation).filter(
+        conversation = self.db.query(Conversation).options(
+            joinedload(Conversation.details)
+        ).filter(
             Conversation.id == conversation_id
         ).first()
         
@@ -260,7 +262,7 @@ class CompletenessManager:
             return {"error": "Conversation not found"}
         
         # Add to skipped questions list
-        skipped_questions = conversation.skipped_questions or []
+        skipped_questions = conversation.details.skipped_questions or []
         skip_entry = {
             "question_id": question_id,
             "skipped_at": datetime.now().isoformat(),
@@ -268,7 +270,7 @@ class CompletenessManager:
             "can_return_later": True
         }
         skipped_questions.append(skip_entry)
-        conversation.skipped_questions = skipped_questions
+        conversation.details.skipped_questions = skipped_questions
         
         # Update question tracking
         question_track = self.db.query(QuestionTracking).filter(
@@ -291,7 +293,9 @@ class CompletenessManager:
     
     def handle_unclear_response(self, conversation_id: int, question_id: str, user_response: str) -> Dict[str, Any]:
         """Handle unclear or vague responses that need clarification."""
-        conversation = self.db.query(Conversation).filter(
+        conversation = self.db.query(Conversation).options(
+            joinedload(Conversation.details)
+        ).filter(
             Conversation.id == conversation_id
         ).first()
         
@@ -299,7 +303,7 @@ class CompletenessManager:
             return {"error": "Conversation not found"}
         
         # Add to unclear responses list
-        unclear_responses = conversation.unclear_responses or []
+        unclear_responses = conversation.details.unclear_responses or []
         unclear_entry = {
             "question_id": question_id,
             "response": user_response,
@@ -308,7 +312,7 @@ class CompletenessManager:
             "clarification_attempts": 0
         }
         unclear_responses.append(unclear_entry)
-        conversation.unclear_responses = unclear_responses
+        conversation.details.unclear_responses = unclear_responses
         
         # Update question tracking
         question_track = self.db.query(QuestionTracking).filter(
@@ -341,7 +345,9 @@ class CompletenessManager:
     
     def check_timeout_status(self, conversation_id: int) -> Dict[str, Any]:
         """Check if conversation has timed out and handle accordingly."""
-        conversation = self.db.query(Conversation).filter(
+        conversation = self.db.query(Conversation).options(
+            joinedload(Conversation.details)
+        ).filter(
             Conversation.id == conversation_id
         ).first()
         
@@ -353,13 +359,13 @@ class CompletenessManager:
         idle_minutes = (now - last_activity).total_seconds() / 60
         
         # Check for different timeout levels
-        if idle_minutes >= conversation.session_timeout_minutes:
+        if idle_minutes >= conversation.details.session_timeout_minutes:
             # Session timeout - end session
             return self._handle_session_timeout(conversation)
-        elif idle_minutes >= conversation.idle_timeout_minutes:
+        elif idle_minutes >= conversation.details.idle_timeout_minutes:
             # Idle timeout - send warning
             return self._handle_idle_timeout(conversation, idle_minutes)
-        elif idle_minutes >= (conversation.idle_timeout_minutes * 0.7):
+        elif idle_minutes >= (conversation.details.idle_timeout_minutes * 0.7):
             # Approaching timeout - gentle nudge
             return self._handle_approaching_timeout(conversation, idle_minutes)
         
@@ -400,19 +406,19 @@ class CompletenessManager:
     
     def _handle_idle_timeout(self, conversation: Conversation, idle_minutes: float) -> Dict[str, Any]:
         """Handle idle timeout warning."""
-        conversation.timeout_warnings += 1
-        conversation.last_timeout_warning = datetime.now()
+        conversation.details.timeout_warnings += 1
+        conversation.details.last_timeout_warning = datetime.now()
         
         timeout_event = TimeoutEvent(
             conversation_id=conversation.id,
-            event_type="warning" if conversation.timeout_warnings == 1 else "final_warning",
+            event_type="warning" if conversation.details.timeout_warnings == 1 else "final_warning",
             timeout_duration=int(idle_minutes * 60),
             warning_message="Idle timeout warning sent"
         )
         self.db.add(timeout_event)
         self.db.commit()
         
-        if conversation.timeout_warnings == 1:
+        if conversation.details.timeout_warnings == 1:
             message = ("Still with me? Let me know if you'd like to continue or take a break. "
                       "I can save your progress if you need to step away.")
         else:
@@ -422,7 +428,7 @@ class CompletenessManager:
         return {
             "status": "idle_warning",
             "message": message,
-            "warning_count": conversation.timeout_warnings,
+            "warning_count": conversation.details.timeout_warnings,
             "can_continue": True,
             "can_pause": True
         }
@@ -432,20 +438,22 @@ class CompletenessManager:
         return {
             "status": "approaching_timeout",
             "gentle_nudge": "How are you doing? Ready for the next question?",
-            "minutes_until_warning": conversation.idle_timeout_minutes - idle_minutes
+            "minutes_until_warning": conversation.details.idle_timeout_minutes - idle_minutes
         }
     
     def request_human_handoff(self, conversation_id: int, reason: str) -> Dict[str, Any]:
         """Handle request for human handoff."""
-        conversation = self.db.query(Conversation).filter(
+        conversation = self.db.query(Conversation).options(
+            joinedload(Conversation.details)
+        ).filter(
             Conversation.id == conversation_id
         ).first()
         
         if not conversation:
             return {"error": "Conversation not found"}
         
-        conversation.requested_human_handoff = True
-        conversation.handoff_reason = reason
+        conversation.details.requested_human_handoff = True
+        conversation.details.handoff_reason = reason
         
         # Save current progress if meets threshold
         if conversation.min_data_threshold_met:
@@ -12,6 +12,7 @@ import json
 import hashlib
 
 from ..config.models import Conversation, Message, QuestionTracking
+from ..config.queries import MESSAGES_BY_CONVERSATION
 from ..config.database import get_db
 
 
@@ -32,9 +33,9 @@ class ConversationMemory:
             return {"error": "Conversation not found"}
         
         # Get all messages in chronological order
-        messages = self.db.query(Message).filter(
-            Message.conversation_id == conversation.id
-        ).order_by(Message.timestamp).all()
+        messages = self.db.execute(
+            MESSAGES_BY_CONVERSATION, {"conversation_id": conversation.id}
+        ).scalars().all()
         
         # Get all asked questions
         asked_questions = self.db.query(QuestionTracking).filter(
@@ -330,7 +331,7 @@ class ConversationMemory:
         
         # Create hash of remaining meaningful words
         intent_string = " ".join(sorted(words))
-        return hashlib.md5(intent_string.encode()).hexdigest()[:8]
+        return hashlib.blake2b(intent_string.encode(), digest_size=8).hexdigest()
     
     def _analyze_missing_information(self, collected_data: Dict[str, Any], 
                                    asked_questions: Dict[str, Any]) -> Dict[str, Any]:
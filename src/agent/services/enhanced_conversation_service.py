@@ -12,8 +12,10 @@ from sqlalchemy.orm import Session
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
-from ..config.models import Conversation, Message, User
+from ..config.models import Conversation, User
+from ..config.queries import MESSAGES_BY_CONVERSATION
 from ..config.database import get_db
+from ..config.openai_client import get_openai_async_client, get_openai_http_client
 
 
 class EnhancedConversationService:
@@ -24,7 +26,9 @@ class EnhancedConversationService:
         self.llm = ChatOpenAI(
             model="gpt-4o-mini",
             api_key=openai_api_key,
-            temperature=0.8  # Higher temperature for more personality
+            temperature=0.8,  # Higher temperature for more personality
+            http_client=get_openai_http_client(),
+            http_async_client=get_openai_async_client()
         )
     
     def adapt_conversation_personality(self, session_id: str, user_communication_style: str, 
@@ -198,9 +202,9 @@ class EnhancedConversationService:
             return {"error": "Conversation not found"}
         
         # Get messages
-        messages = self.db.query(Message).filter(
-            Message.conversation_id == conversation.id
-        ).order_by(Message.timestamp).all()
+        messages = self.db.execute(
+            MESSAGES_BY_CONVERSATION, {"conversation_id": conversation.id}
+        ).scalars().all()
         
         conversation_text = []
         for msg in messages:
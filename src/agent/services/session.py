@@ -3,10 +3,12 @@
 import json
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from ..config.models import Conversation, SessionStatus, Message, User
+from ..config.queries import MESSAGES_BY_CONVERSATION
 
 
 class SessionService:
@@ -14,6 +16,7 @@ class SessionService:
 
     def __init__(self, db: Session):
         self.db = db
+        self._pending_messages: List[Dict[str, Any]] = []
 
     def begin_conversation(self, user: User) -> Conversation:
         """Begin a new conversation transaction."""
@@ -32,15 +35,15 @@ class SessionService:
 
     def get_latest_incomplete_conversation(self, user: User) -> Optional[Conversation]:
         """Get the latest incomplete conversation for a user."""
-        return (
-            self.db.query(Conversation)
-            .filter(
+        return self.db.execute(
+            select(Conversation)
+            .where(
                 Conversation.user_id == user.id,
                 Conversation.status == SessionStatus.INCOMPLETE.value
             )
             .order_by(Conversation.started_at.desc())
-            .first()
-        )
+            .limit(1)
+        ).scalars().first()
 
     def is_conversation_expired(self, conversation: Conversation, hours: int = 24) -> bool:
         """Check if conversation is expired based on last update."""
@@ -83,14 +86,29 @@ class SessionService:
         self.db.flush()
         return message
 
+    def queue_message(self, conversation: Conversation, role: str, content: str, **fields: Any) -> None:
+        """Buffer a message row to be written by the next flush_messages() call."""
+        self._pending_messages.append({
+            "conversation_id": conversation.id,
+            "role": role,
+            "content": content,
+            **fields
+        })
+
+    def flush_messages(self, rows: Optional[List[Dict[str, Any]]] = None) -> int:
+        """Write buffered (or the given) message rows in a single bulk INSERT."""
+        if rows is None:
+            rows, self._pending_messages = self._pending_messages, []
+        
+        if rows:
+            self.db.bulk_insert_mappings(Message, rows, return_defaults=False)
+        return len(rows)
+
     def get_conversation_messages(self, conversation: Conversation) -> list[Message]:
         """Get all messages for a conversation."""
-        return (
-            self.db.query(Message)
-            .filter(Message.conversation_id == conversation.id)
-            .order_by(Message.timestamp.asc())
-            .all()
-        )
+        return list(self.db.execute(
+            MESSAGES_BY_CONVERSATION, {"conversation_id": conversation.id}
+        ).scalars().all())
 
     def complete_conversation(self, conversation: Conversation) -> Conversation:
         """Mark conversation as completed."""
@@ -114,9 +132,9 @@ class SessionService:
     def rollback_conversation(self, conversation: Conversation):
         """Rollback and discard conversation."""
         # Delete all messages associated with this conversation
-        self.db.query(Message).filter(
-            Message.conversation_id == conversation.id
-        ).delete()
+        self.db.execute(
+            delete(Message).where(Message.conversation_id == conversation.id)
+        )
         
         # Delete the conversation
         self.db.delete(conversation)
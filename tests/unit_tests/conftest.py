@@ -0,0 +1,30 @@
+"""Shared fixtures for the unit tests."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from agent.config.models import Base, Conversation, Message, User
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with one user, one conversation and three messages."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    user = User(user_id="user")
+    session.add(user)
+    session.flush()
+    conversation = Conversation(user_id=user.id, session_id="session")
+    session.add(conversation)
+    session.flush()
+    session.add_all(
+        Message(conversation_id=conversation.id, role="user", content=f"message {i}")
+        for i in range(3)
+    )
+    session.commit()
+    session.expunge_all()
+    yield session
+    session.close()
+    engine.dispose()
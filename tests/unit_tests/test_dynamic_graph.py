@@ -0,0 +1,101 @@
+"""Routing and failure handling of the Dynamic Vi LangGraph agent."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+import agent.langgraph_agent.dynamic_langgraph_agent as dynamic_agent
+from agent.langgraph_agent.dynamic_langgraph_agent import (
+    TURN_FALLBACK_REPLY,
+    new_state,
+    orchestrator_node,
+)
+
+
+@pytest.fixture
+def failing_model(monkeypatch):
+    """Make every LLM call fail the way a missing API key does."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(dynamic_agent, "_llms", {})
+    monkeypatch.setattr(dynamic_agent, "_structured_llms", {})
+
+
+def _decide(**fields) -> str:
+    state = new_state("user")
+    state.update(fields)
+    return asyncio.run(orchestrator_node(state)).update["next_step"]
+
+
+def test_orchestrator_rule_table(monkeypatch) -> None:
+    monkeypatch.setattr(dynamic_agent, "FUSED_TURN_PROCESSING", True)
+    greeted = [AIMessage(content="Hi, how old are you?")]
+    replied = greeted + [HumanMessage(content="25")]
+
+    assert _decide() == "greeting_agent"
+    assert _decide(conversation_complete=True, total_messages=2, messages=replied) == "END"
+    assert _decide(emergency_level="HIGH", total_messages=2, messages=replied) == "emergency_agent"
+    assert _decide(total_messages=50, completion_readiness=0.6, messages=replied) == "completion_agent"
+    assert _decide(total_messages=2, messages=replied, ai_context={"last_agent_action": "extraction_complete"}) == "evaluation_agent"
+    assert _decide(total_messages=2, messages=replied) == "process_turn"
+    assert _decide(total_messages=1, messages=greeted, ai_message_count=1) == "END"
+    # Counters without a working history must not index into an empty list
+    assert _decide(total_messages=3, messages=[]) == "END"
+
+    monkeypatch.setattr(dynamic_agent, "FUSED_TURN_PROCESSING", False)
+    assert _decide(total_messages=2, messages=replied) == "extraction_agent"
+
+
+def test_orchestrator_ends_turn_after_failed_agent_call() -> None:
+    state = new_state("user")
+    state.update(total_messages=2, messages=[AIMessage(content="Hi"), HumanMessage(content="25")], retry_count=1)
+
+    command = asyncio.run(orchestrator_node(state))
+
+    assert command.goto == dynamic_agent.END
+    assert command.update["retry_count"] == 0
+    assert command.update["messages"][-1].content == TURN_FALLBACK_REPLY
+
+
+def test_step_by_step_turn_ends_when_model_fails(monkeypatch, failing_model) -> None:
+    monkeypatch.setattr(dynamic_agent, "FUSED_TURN_PROCESSING", False)
+
+    result = asyncio.run(
+        dynamic_agent.graph.ainvoke(new_state("user", "I am 25"), {"recursion_limit": 25})
+    )
+
+    assert result["messages"][-1].content == TURN_FALLBACK_REPLY
+    assert result["retry_count"] == 0
+
+
+def test_fused_turn_falls_back_once_then_ends(monkeypatch, failing_model) -> None:
+    monkeypatch.setattr(dynamic_agent, "FUSED_TURN_PROCESSING", True)
+    calls = []
+    extraction_agent_node = dynamic_agent.extraction_agent_node
+
+    async def counting_extraction(state):
+        calls.append(state["retry_count"])
+        return await extraction_agent_node(state)
+
+    monkeypatch.setattr(dynamic_agent, "extraction_agent_node", counting_extraction)
+    dynamic_agent.get_graph.cache_clear()
+    try:
+        result = asyncio.run(
+            dynamic_agent.graph.ainvoke(new_state("user", "I am 25"), {"recursion_limit": 25})
+        )
+    finally:
+        dynamic_agent.get_graph.cache_clear()
+
+    assert calls == [1]
+    assert result["messages"][-1].content == TURN_FALLBACK_REPLY
+    assert result["retry_count"] == 0
+
+
+def test_turn_processor_gives_up_after_the_fallback(failing_model) -> None:
+    state = new_state("user", "I am 25")
+    state.update(total_messages=1, user_message_count=1, retry_count=1)
+
+    result = asyncio.run(dynamic_agent.process_turn_node(state))
+
+    assert result["next_step"] == "END"
+    assert result["messages"][-1].content == TURN_FALLBACK_REPLY
@@ -0,0 +1,66 @@
+"""Capped working history and full-transcript archive of the Dynamic Vi graph."""
+
+import asyncio
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from agent.langgraph_agent.dynamic_langgraph_agent import (
+    MAX_HISTORY_MESSAGES,
+    _append_ai_message,
+    add_messages_capped,
+    initialize_session_node,
+    new_state,
+)
+
+
+def _transcript(count: int) -> list:
+    return [
+        (AIMessage if i % 2 == 0 else HumanMessage)(content=f"message {i}", id=f"m{i}")
+        for i in range(count)
+    ]
+
+
+def test_reducer_caps_the_merged_history() -> None:
+    history = _transcript(MAX_HISTORY_MESSAGES)
+    reply = AIMessage(content="new", id="new")
+
+    merged = add_messages_capped(history, [reply])
+
+    assert len(merged) == MAX_HISTORY_MESSAGES
+    assert merged[0].id == "m1"
+    assert merged[-1] is reply
+
+
+def test_reducer_caps_a_node_returning_the_channel_list() -> None:
+    history = _transcript(MAX_HISTORY_MESSAGES + 5)
+
+    capped = add_messages_capped(history, history)
+
+    assert [msg.id for msg in capped] == [msg.id for msg in history[-MAX_HISTORY_MESSAGES:]]
+
+
+def test_archive_keeps_the_transcript_past_the_cap() -> None:
+    transcript = _transcript(MAX_HISTORY_MESSAGES + 5)
+    answer = HumanMessage(content="I am 25", id="answer")
+    state = new_state("user")
+    state["message_archive"] = list(transcript)
+    state["messages"] = transcript[-MAX_HISTORY_MESSAGES:] + [answer]
+
+    state = asyncio.run(initialize_session_node(state))
+
+    assert len(state["message_archive"]) == len(transcript) + 1
+    assert state["total_messages"] == len(transcript) + 1
+    assert state["user_message_count"] == sum(isinstance(msg, HumanMessage) for msg in transcript) + 1
+    assert state["last_user_message"] == "I am 25"
+
+
+def test_append_ai_message_updates_history_archive_and_counters() -> None:
+    state = new_state("user", "hello")
+    state = asyncio.run(initialize_session_node(state))
+
+    _append_ai_message(state, "Hi there")
+
+    assert state["messages"][-1].content == "Hi there"
+    assert state["message_archive"][-1] is state["messages"][-1]
+    assert state["messages"][-1].id
+    assert (state["total_messages"], state["ai_message_count"]) == (2, 1)
@@ -0,0 +1,18 @@
+"""Message history queries load message content in the same SELECT."""
+
+from sqlalchemy import event
+
+from agent.config.models import Conversation
+from agent.services.session import SessionService
+
+
+def test_conversation_messages_load_content_in_one_query(db) -> None:
+    conversation = db.query(Conversation).filter_by(session_id="session").one()
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    messages = SessionService(db).get_conversation_messages(conversation)
+    contents = [msg.content for msg in messages]
+
+    assert contents == ["message 0", "message 1", "message 2"]
+    assert len(statements) == 1
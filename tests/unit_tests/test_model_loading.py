@@ -0,0 +1,31 @@
+"""Per-turn lookups don't eagerly pull a user's or conversation's history."""
+
+from sqlalchemy import event
+
+from agent.config.queries import CONVERSATION_BY_SESSION_ID, USER_BY_USER_ID
+
+
+def _count_statements(db):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_user_lookup_is_a_single_query(db) -> None:
+    statements = _count_statements(db)
+
+    user = db.execute(USER_BY_USER_ID, {"user_id": "user"}).scalars().one()
+
+    assert user.user_id == "user"
+    assert len(statements) == 1
+
+
+def test_conversation_lookup_leaves_collections_unloaded(db) -> None:
+    statements = _count_statements(db)
+
+    conversation = db.execute(CONVERSATION_BY_SESSION_ID, {"session_id": "session"}).scalars().one()
+
+    assert len(statements) == 1
+    assert "messages" not in conversation.__dict__
+    # Still reachable on demand, in timestamp order
+    assert [msg.content for msg in conversation.messages] == ["message 0", "message 1", "message 2"]
@@ -0,0 +1,70 @@
+"""Node cache behaviour for the extraction agent."""
+
+import asyncio
+
+from langgraph.graph import END, StateGraph
+
+import agent.langgraph_agent.dynamic_langgraph_agent as dynamic_agent
+from agent.langgraph_agent.dynamic_langgraph_agent import (
+    EXTRACTION_INPUT_KEYS,
+    DynamicViLangGraphState,
+    ExtractionResult,
+    SuccessOnlyCache,
+    _node_cache_policy,
+    extraction_agent_node,
+    new_state,
+)
+
+
+class FlakyExtractionLLM:
+    """Structured LLM stub that fails on its first call and succeeds afterwards."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def ainvoke(self, messages: list) -> ExtractionResult:
+        self.calls += 1
+        if self.calls == 1:
+            raise TimeoutError("upstream timeout")
+        return ExtractionResult(
+            extracted_field="age",
+            extracted_value="25",
+            additional_extractions=[],
+            extraction_confidence=0.9,
+            user_cooperative=True,
+        )
+
+
+def _extraction_graph():
+    workflow = StateGraph(DynamicViLangGraphState)
+    workflow.add_node(
+        "extraction_agent",
+        extraction_agent_node,
+        cache_policy=_node_cache_policy(EXTRACTION_INPUT_KEYS),
+    )
+    workflow.set_entry_point("extraction_agent")
+    workflow.add_edge("extraction_agent", END)
+    return workflow.compile(cache=SuccessOnlyCache())
+
+
+def test_failed_extraction_is_not_replayed_from_cache(monkeypatch) -> None:
+    llm = FlakyExtractionLLM()
+    monkeypatch.setitem(
+        dynamic_agent._structured_llms, ("extraction", ExtractionResult), llm
+    )
+    graph = _extraction_graph()
+
+    failed = asyncio.run(graph.ainvoke(new_state("user", "I am 25")))
+    assert failed["retry_count"] == 1
+    assert "age" not in failed["collected_data"]
+
+    # Same input again: the failure was not cached, so the LLM is called and succeeds
+    succeeded = asyncio.run(graph.ainvoke(new_state("user", "I am 25")))
+    assert llm.calls == 2
+    assert succeeded["retry_count"] == 0
+    assert succeeded["collected_data"]["age"] == "25"
+
+    # The successful update is cached and replayed without another LLM call
+    replayed = asyncio.run(graph.ainvoke(new_state("user", "I am 25")))
+    assert llm.calls == 2
+    assert replayed["collected_data"]["age"] == "25"
@@ -0,0 +1,57 @@
+"""The user sessions route looks conversations up by the public user id."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from agent.config.database import get_async_db
+from agent.config.models import Base, Conversation, Message, User
+from agent.routers.medical import router
+
+
+@pytest.fixture
+def client(tmp_path):
+    url = f"sqlite:///{tmp_path / 'sessions.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        # A second user first, so the public id and the integer key differ
+        db.add(User(user_id="someone-else"))
+        user = User(user_id="patient-42")
+        db.add(user)
+        db.flush()
+        conversation = Conversation(user_id=user.id, session_id="session-1")
+        db.add(conversation)
+        db.flush()
+        db.add(Message(conversation_id=conversation.id, role="user", content="I have a headache"))
+        db.commit()
+    engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'sessions.db'}")
+    async_session = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with async_session() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_sessions_are_found_by_public_user_id(client) -> None:
+    body = client.get("/medical/user/patient-42/sessions").json()
+
+    assert body["total_sessions"] == 1
+    session = body["sessions"][0]
+    assert session["session_id"] == "session-1"
+    assert session["conversation_history"][0]["content"] == "I have a headache"
+
+
+def test_unknown_user_has_no_sessions(client) -> None:
+    assert client.get("/medical/user/nobody/sessions").json()["total_sessions"] == 0
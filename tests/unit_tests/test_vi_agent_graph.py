@@ -0,0 +1,131 @@
+"""Failure handling and event-loop bridging of the DynamicViAgent multi-agent graph."""
+
+import asyncio
+import json
+import threading
+from typing import List
+
+import anyio
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.errors import GraphRecursionError
+
+from agent.medical_assistant_agent.result import DynamicViAgent
+
+
+class EvaluationTimeoutLLM(BaseChatModel):
+    """Chat model stub that routes to extraction, extracts, and times out on evaluation."""
+
+    calls: List[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "evaluation-timeout"
+
+    def _generate(self, messages: List[BaseMessage], stop=None, run_manager=None, **kwargs) -> ChatResult:
+        system_prompt = messages[0].content
+        context = json.loads(messages[1].content)
+        if "ORCHESTRATOR" in system_prompt:
+            self.calls.append("orchestrator")
+            next_agent = "EVALUATION_AGENT" if context["last_agent_action"] == "extraction_complete" else "EXTRACTION_AGENT"
+            content = json.dumps({"next_agent": next_agent, "priority_field": "age", "reasoning": "test"})
+        elif "EXTRACTION" in system_prompt:
+            self.calls.append("extraction")
+            content = json.dumps({"target_field": "age", "extracted_value": "25", "additional_data": {}})
+        elif "EVALUATION" in system_prompt:
+            self.calls.append("evaluation")
+            raise TimeoutError("evaluation timed out")
+        else:
+            self.calls.append("other")
+            content = "Thanks, what is your biological sex?"
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+
+def test_failed_evaluation_ends_the_turn() -> None:
+    agent = DynamicViAgent(None, "test-key")
+    llm = EvaluationTimeoutLLM(calls=[])
+    agent.agent_functions.llm = llm
+    state = {
+        "messages": [AIMessage(content="Hi! How old are you?"), HumanMessage(content="I am 25")],
+        "session_id": "session",
+        "user_id": "user",
+        "conversation_complete": False,
+        "collected_fields": {},
+        "current_field": "age",
+        "next_step": "orchestrator",
+        "conversation_memory": {},
+        "ai_context": {},
+        "emergency_level": "NONE",
+        "emergency_flags": [],
+        "retry_count": 0,
+        "completion_readiness": 0.0,
+        "message_tally": None,
+    }
+
+    result = asyncio.run(agent.graph.ainvoke(state, {"recursion_limit": 25}))
+
+    assert llm.calls == ["orchestrator", "extraction", "evaluation"]
+    assert result["ai_context"]["last_agent_action"] == "evaluation_agent_error"
+    assert result["messages"][-1].content.startswith("I'm sorry")
+
+
+class RecordingGraph:
+    """Graph stub that records the thread each run happens on."""
+
+    def __init__(self, error: Exception = None) -> None:
+        self.threads = []
+        self.error = error
+
+    async def ainvoke(self, state):
+        self.threads.append(threading.get_ident())
+        if self.error:
+            raise self.error
+        return state
+
+
+def _agent_with(graph: RecordingGraph) -> DynamicViAgent:
+    agent = DynamicViAgent(None, "test-key")
+    agent.graph = graph
+    return agent
+
+
+def test_run_graph_from_plain_sync_code() -> None:
+    graph = RecordingGraph()
+
+    assert _agent_with(graph)._run_graph({"messages": []}) == {"messages": []}
+    assert graph.threads == [threading.get_ident()]
+
+
+def test_run_graph_from_a_coroutine() -> None:
+    graph = RecordingGraph()
+
+    async def call():
+        return _agent_with(graph)._run_graph({"messages": []})
+
+    assert asyncio.run(call()) == {"messages": []}
+    assert graph.threads and graph.threads[0] != threading.get_ident()
+
+
+def test_run_graph_from_a_worker_thread_uses_the_server_loop() -> None:
+    graph = RecordingGraph()
+
+    async def serve():
+        result = await anyio.to_thread.run_sync(_agent_with(graph)._run_graph, {"messages": []})
+        return result, threading.get_ident()
+
+    result, loop_thread = asyncio.run(serve())
+    assert result == {"messages": []}
+    assert graph.threads == [loop_thread]
+
+
+def test_run_graph_errors_are_not_retried_on_another_loop() -> None:
+    graph = RecordingGraph(error=GraphRecursionError("too deep"))
+
+    async def serve():
+        await anyio.to_thread.run_sync(_agent_with(graph)._run_graph, {"messages": []})
+
+    with pytest.raises(GraphRecursionError):
+        asyncio.run(serve())
+    assert len(graph.threads) == 1
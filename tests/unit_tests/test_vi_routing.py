@@ -0,0 +1,55 @@
+"""route_to_agent's precomputed table against the original if-chain."""
+
+import itertools
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from agent.medical_assistant_agent.agents import AgentFunctions
+from agent.medical_assistant_agent.states import AgentStep
+
+STEPS = [agent.value for agent in AgentStep] + ["END", "unknown_step"]
+LAST_ACTIONS = ["none", "question_asked", "extraction_complete", "evaluation_agent_error"]
+
+
+def reference_route(ai_count: int, user_count: int, next_step: str, last_agent_action: str) -> str:
+    """The routing rules as route_to_agent wrote them before the table."""
+    if ai_count == 0 and user_count == 0 and next_step == AgentStep.GREETING_AGENT.value:
+        return next_step
+    if ai_count > user_count:
+        return "END"
+    if next_step in [AgentStep.EXTRACTION_AGENT.value, AgentStep.EVALUATION_AGENT.value]:
+        return next_step
+    if last_agent_action == "question_asked" and ai_count >= user_count:
+        return "END"
+    return next_step
+
+
+def _state(ai_count: int, user_count: int, next_step: str, last_agent_action: str) -> dict:
+    messages = [AIMessage(content="ai")] * ai_count + [HumanMessage(content="user")] * user_count
+    return {
+        "messages": messages,
+        "next_step": next_step,
+        "ai_context": {"last_agent_action": last_agent_action},
+        "message_tally": None,
+    }
+
+
+@pytest.mark.parametrize(
+    ("ai_count", "user_count"), list(itertools.product(range(4), range(4)))
+)
+def test_route_table_matches_reference(ai_count: int, user_count: int) -> None:
+    functions = AgentFunctions(None, None)
+    for next_step, last_action in itertools.product(STEPS, LAST_ACTIONS):
+        state = _state(ai_count, user_count, next_step, last_action)
+        expected = reference_route(ai_count, user_count, next_step, last_action)
+        assert functions.route_to_agent(state) == expected, (ai_count, user_count, next_step, last_action)
+
+
+def test_route_examples() -> None:
+    functions = AgentFunctions(None, None)
+    assert functions.route_to_agent(_state(0, 0, "greeting_agent", "none")) == "greeting_agent"
+    assert functions.route_to_agent(_state(2, 1, "question_agent", "none")) == "END"
+    assert functions.route_to_agent(_state(1, 1, "evaluation_agent", "question_asked")) == "evaluation_agent"
+    assert functions.route_to_agent(_state(1, 1, "question_agent", "question_asked")) == "END"
+    assert functions.route_to_agent(_state(1, 2, "question_agent", "question_asked")) == "question_agent"